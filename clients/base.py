@@ -6,6 +6,7 @@ that communicate with real MCP servers via the Model Context Protocol.
 """
 
 import asyncio
+import itertools
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -57,6 +58,9 @@ class BaseMCPClient(ABC):
         self._config = None
         self._process = None
         self._session_id = None
+        # One request/response exchange at a time over the stdio pipes
+        self._request_lock = asyncio.Lock()
+        self._request_counter = itertools.count(1)
 
         logger.info(
             f"Initialized {self.__class__.__name__} for server '{self.server_name}'"
@@ -208,14 +212,30 @@ class BaseMCPClient(ABC):
                 f"Failed to start MCP server '{self.server_name}': {e}"
             )
 
+    def _new_request_id(self) -> str:
+        """Return a JSON-RPC id that no earlier request of this client used."""
+        return f"req_{next(self._request_counter)}"
+
     async def _send_mcp_request(
         self, method: str, params: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Send JSON-RPC request to MCP server using async I/O."""
+        """
+        Send JSON-RPC request to MCP server using async I/O.
+
+        Responses are read back in order from the server's stdout, so
+        concurrent callers sharing this client take turns.
+        """
+        async with self._request_lock:
+            return await self._exchange_mcp_request(method, params)
+
+    async def _exchange_mcp_request(
+        self, method: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Write one request and read its response; callers hold the lock."""
         if not self._process:
             await self._start_server_process()
 
-        request_id = f"req_{asyncio.current_task().get_name()}_{id(params)}"
+        request_id = self._new_request_id()
 
         request = {
             "jsonrpc": "2.0",
@@ -235,35 +255,46 @@ class BaseMCPClient(ABC):
             self._process.stdin.write(request_json.encode())
             await self._process.stdin.drain()
 
-            # Read response using async readline with timeout
-            try:
-                response_line = await asyncio.wait_for(
-                    self._process.stdout.readline(),
-                    timeout=30.0,  # 30 second timeout
-                )
-            except asyncio.TimeoutError:
-                logger.error(f"MCP server '{self.server_name}' response timeout")
-                raise MCPConnectionError(
-                    f"MCP server '{self.server_name}' response timeout"
-                )
-
-            if not response_line:
-                # Use timeout for non-blocking stderr read
+            # Read until the response to this request; lines left over from
+            # an abandoned exchange, or notifications, carry another id
+            while True:
+                # Read response using async readline with timeout
                 try:
-                    stderr_data = await asyncio.wait_for(
-                        self._process.stderr.read(1024), timeout=0.5
-                    )
-                    stderr_output = (
-                        stderr_data.decode() if stderr_data else "No stderr output"
+                    response_line = await asyncio.wait_for(
+                        self._process.stdout.readline(),
+                        timeout=30.0,  # 30 second timeout
                     )
                 except asyncio.TimeoutError:
-                    stderr_output = "No stderr available (timeout)"
-                logger.error(f"No response from MCP server. Stderr: {stderr_output}")
-                raise MCPConnectionError(
-                    f"No response from MCP server. Stderr: {stderr_output}"
-                )
+                    logger.error(f"MCP server '{self.server_name}' response timeout")
+                    raise MCPConnectionError(
+                        f"MCP server '{self.server_name}' response timeout"
+                    )
 
-            response = json.loads(response_line.decode().strip())
+                if not response_line:
+                    # Use timeout for non-blocking stderr read
+                    try:
+                        stderr_data = await asyncio.wait_for(
+                            self._process.stderr.read(1024), timeout=0.5
+                        )
+                        stderr_output = (
+                            stderr_data.decode() if stderr_data else "No stderr output"
+                        )
+                    except asyncio.TimeoutError:
+                        stderr_output = "No stderr available (timeout)"
+                    logger.error(
+                        f"No response from MCP server. Stderr: {stderr_output}"
+                    )
+                    raise MCPConnectionError(
+                        f"No response from MCP server. Stderr: {stderr_output}"
+                    )
+
+                response = json.loads(response_line.decode().strip())
+                if response.get("id") == request_id:
+                    break
+                logger.debug(
+                    f"Discarding MCP message not for request {request_id}: "
+                    f"id={response.get('id')!r}"
+                )
 
             # Log incoming response, truncate if large
             response_str = json.dumps(response)
@@ -380,6 +411,115 @@ class BaseMCPClient(ABC):
             f"Tool '{tool_name}' failed after {retry_count + 1} attempts: {last_error}"
         )
 
+    async def call_tool_batch(
+        self,
+        tool_name: str,
+        params_list: list[Dict[str, Any]],
+        retry_count: int = 3,
+    ) -> list[Any]:
+        """
+        Call one MCP tool for several parameter sets in a single exchange.
+
+        All requests are written to the server before any response is read,
+        so the batch costs one round trip instead of one per call. Calls that
+        failed or went unanswered in the pipelined exchange are retried one
+        by one with call_tool_with_retry(), which skips any late responses
+        to the batch since they carry other request ids.
+
+        Args:
+            tool_name: Name of the MCP tool to call
+            params_list: Parameters for each call
+            retry_count: Number of retry attempts for calls that fall back
+
+        Returns:
+            One entry per parameter set, in order: the tool result, or the
+            exception raised for that call
+        """
+        results: list[Any] = [None] * len(params_list)
+        pending = set(range(len(params_list)))
+
+        async with self._request_lock:
+            try:
+                await self._exchange_tool_batch(
+                    tool_name, params_list, results, pending
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Batched call of tool '{tool_name}' failed, "
+                    f"falling back to single calls: {e}"
+                )
+
+        for index in sorted(pending):
+            try:
+                results[index] = await self.call_tool_with_retry(
+                    tool_name, params_list[index], retry_count=retry_count
+                )
+            except Exception as e:
+                results[index] = e
+
+        return results
+
+    async def _exchange_tool_batch(
+        self,
+        tool_name: str,
+        params_list: list[Dict[str, Any]],
+        results: list[Any],
+        pending: set[int],
+    ) -> None:
+        """Pipeline tools/call requests, filling results and pending by index."""
+        if not self._process:
+            await self._start_server_process()
+
+        request_ids = {self._new_request_id(): index for index in pending}
+
+        logger.debug(f"Sending {len(request_ids)} batched calls of tool '{tool_name}'")
+        self._process.stdin.write(
+            b"".join(
+                (
+                    json.dumps(
+                        {
+                            "jsonrpc": "2.0",
+                            "id": request_id,
+                            "method": "tools/call",
+                            "params": {
+                                "name": tool_name,
+                                "arguments": params_list[index],
+                            },
+                        }
+                    )
+                    + "\n"
+                ).encode()
+                for request_id, index in request_ids.items()
+            )
+        )
+        await self._process.stdin.drain()
+
+        unanswered = set(pending)
+        while unanswered:
+            response_line = await asyncio.wait_for(
+                self._process.stdout.readline(), timeout=30.0
+            )
+            if not response_line:
+                raise MCPConnectionError(
+                    f"MCP server '{self.server_name}' closed during batched call"
+                )
+
+            response = json.loads(response_line)
+            index = request_ids.get(response.get("id"))
+            if index is None or index not in unanswered:
+                continue
+            unanswered.discard(index)
+
+            if "error" in response:
+                # Left pending, so the call is retried like a single call
+                error_message = response["error"].get("message", "Unknown error")
+                logger.warning(
+                    f"Batched call of tool '{tool_name}' failed: {error_message}"
+                )
+            else:
+                results[index] = response.get("result", {})
+                pending.discard(index)
+
     async def close(self):
         """Close MCP server connection and cleanup resources."""
         if self._process:
@@ -6,33 +6,128 @@ preserving directory structure during file extraction. Can be used for any
 entity type, not just databases.
 """
 
+import asyncio
+import functools
+import itertools
+import mmap
+import os
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Protocol
 from dataclasses import dataclass
 import logging
 
+try:
+    # MRAB's regex module is a drop-in replacement for re that is usually
+    # faster on long alternations over large inputs. RE2 is not used: its \b
+    # only knows ASCII word characters, so counts would differ from re's.
+    import regex as _pattern_engine
+except ImportError:
+    _pattern_engine = re
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class _CompiledPattern(Protocol):
+    """The part of a compiled pattern used here, shared by re and regex."""
+
+    pattern: str
+
+    def findall(self, string: str) -> list: ...
+
+
+# Entity names recur across pattern sets, so each is escaped only once
+_escape_pattern = functools.lru_cache(maxsize=1024)(re.escape)
+
+
+@functools.lru_cache(maxsize=1024)
+def _word_boundary_regex(
+    patterns: tuple[str, ...], case_sensitive: bool
+) -> _CompiledPattern:
+    """Compile one whole-word matcher for all patterns, shared across extractions."""
+    # Longest first so a pattern never loses to one of its own prefixes
+    alternatives = sorted(dict.fromkeys(patterns), key=len, reverse=True)
+    joined = "|".join(_escape_pattern(pattern) for pattern in alternatives)
+    flags = 0 if case_sensitive else _pattern_engine.IGNORECASE
+    return _pattern_engine.compile(rf"\b(?:{joined})\b", flags)
+
+
+_FILE_OPEN_TAG = re.compile(rb'<file path="([^"\n]+)">[ \t\r\f\v]*\n')
+_EDGE_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+
+
+# Matched files held in memory before their contents are written out
+_WRITE_BATCH_SIZE = 32
+
+
+def _write_file(path: Path, content: str) -> None:
+    """Write extracted content; blocking, so callers run it in a thread."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+async def _flush_writes(pending: Dict[Path, str]) -> int:
+    """Write a batch of extracted files in worker threads, then clear it."""
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(_write_file, path, content)
+            for path, content in pending.items()
+        )
+    )
+    written = len(pending)
+    pending.clear()
+    return written
+
+
+def _could_match(content: str, needles: List[str], case_sensitive: bool) -> bool:
+    """Cheap substring check used to skip files before the regex scan."""
+    haystack = content if case_sensitive else content.lower()
+    return any(needle in haystack for needle in needles)
+
+
+def _count_batch_matches(
+    contents: List[str], patterns: tuple[str, ...], case_sensitive: bool
+) -> List[int]:
+    """Count pattern matches for each content; runs in a worker process."""
+    compiled_pattern = _word_boundary_regex(patterns, case_sensitive)
+    needles = [p if case_sensitive else p.lower() for p in patterns]
+    return [
+        (
+            len(compiled_pattern.findall(content))
+            if _could_match(content, needles, case_sensitive)
+            else 0
+        )
+        for content in contents
+    ]
+
+
+@dataclass(slots=True, frozen=True)
 class MatchedFile:
-    """File containing entity references."""
+    """
+    File containing entity references.
+
+    Documents the entries of ExtractionResult.matched_files; the extractor
+    builds those dicts directly rather than going through this class.
+    """
 
     original_path: str
     extracted_path: str
-    content: str
     match_count: int
+    # Only kept when requested; otherwise the text is on disk at extracted_path
+    content: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
+        data = {
             "original_path": self.original_path,
             "extracted_path": self.extracted_path,
-            "content": self.content,
             "match_count": self.match_count,
         }
+        if self.content is not None:
+            data["content"] = self.content
+        return data
 
 
 @dataclass
@@ -59,14 +154,17 @@ class EntityReferenceExtractor:
     or any other entity type in packed repositories.
     """
 
-    def __init__(self, entity_type: str = "entity"):
+    def __init__(self, entity_type: str = "entity", max_workers: int = 1):
         """
         Initialize the entity reference extractor.
 
         Args:
             entity_type: Type of entity being extracted (e.g., 'database', 'service', 'application')
+            max_workers: Worker processes used to scan file contents; 1 scans
+                in-process while streaming the pack
         """
         self.entity_type = entity_type
+        self.max_workers = max_workers
         self.logger = logger
 
     async def extract_references(
@@ -76,6 +174,8 @@ class EntityReferenceExtractor:
         output_dir: Optional[str] = None,
         patterns: Optional[List[str]] = None,
         case_sensitive: bool = False,
+        include_content: bool = False,
+        extract_to_disk: bool = True,
     ) -> ExtractionResult:
         """
         Extract entity references using pattern matching.
@@ -86,6 +186,11 @@ class EntityReferenceExtractor:
             output_dir: Output directory (defaults to tests/tmp/pattern_match/{entity_name})
             patterns: Custom patterns to search for (defaults to entity_name)
             case_sensitive: Whether to use case-sensitive matching
+            include_content: Whether to copy each matched file's text into the
+                result; otherwise read it from its extracted_path
+            extract_to_disk: Whether to write matched files under output_dir;
+                when False only the statistics are produced and extracted_path
+                is where the file would have been written
 
         Returns:
             ExtractionResult with matched files and statistics
@@ -101,30 +206,47 @@ class EntityReferenceExtractor:
             if not patterns:
                 patterns = [entity_name]
 
-            # Read and parse packed repository
-            files = self._parse_repomix_file(target_repo_pack_path)
+            if self.max_workers > 1:
+                scanned = await self._scan_in_processes(
+                    target_repo_pack_path, tuple(patterns), case_sensitive
+                )
+            else:
+                scanned = self._scan_sequentially(
+                    target_repo_pack_path, tuple(patterns), case_sensitive
+                )
 
-            # Find matches using pattern matching
             matched_files = []
             total_references = 0
-
-            for file_info in files:
-                matches = self._find_pattern_matches(
-                    file_info["content"], patterns, case_sensitive
-                )
-                if matches:
-                    extracted_path = self._extract_file(
-                        file_info, output_dir, entity_name
-                    )
-
-                    matched_file = MatchedFile(
-                        original_path=file_info["path"],
-                        extracted_path=extracted_path,
-                        content=file_info["content"],
-                        match_count=len(matches),
-                    )
+            created_dirs: set = set()
+            # Keyed by path, so a file packed twice is written once, last entry winning
+            pending_writes: Dict[Path, str] = {}
+            written = 0
+
+            for file_info, match_count in scanned:
+                if match_count:
+                    if extract_to_disk:
+                        extraction_path = self._extraction_path(
+                            file_info["path"], output_dir, created_dirs
+                        )
+                        pending_writes[extraction_path] = file_info["content"]
+                        if len(pending_writes) >= _WRITE_BATCH_SIZE:
+                            written += await _flush_writes(pending_writes)
+                    else:
+                        extraction_path = Path(output_dir) / file_info["path"]
+
+                    # Same shape as MatchedFile.to_dict(), built in one step
+                    matched_file = {
+                        "original_path": file_info["path"],
+                        "extracted_path": str(extraction_path),
+                        "match_count": match_count,
+                    }
+                    if include_content:
+                        matched_file["content"] = file_info["content"]
                     matched_files.append(matched_file)
-                    total_references += len(matches)
+                    total_references += match_count
+
+            written += await _flush_writes(pending_writes)
+            self.logger.debug(f"Extracted {written} files to {output_dir}")
 
             return ExtractionResult(
                 entity_name=entity_name,
@@ -132,7 +254,7 @@ class EntityReferenceExtractor:
                 source_file=target_repo_pack_path,
                 total_references=total_references,
                 total_files=len(matched_files),
-                matched_files=[mf.to_dict() for mf in matched_files],
+                matched_files=matched_files,
                 extraction_directory=output_dir,
                 success=True,
                 duration_seconds=time.time() - start_time,
@@ -154,53 +276,115 @@ class EntityReferenceExtractor:
                 error=str(e),
             )
 
-    def _parse_repomix_file(self, file_path: str) -> List[Dict[str, str]]:
-        """Parse repomix XML file to extract individual files."""
-        files = []
+    def _scan_sequentially(
+        self, pack_path: str, patterns: tuple[str, ...], case_sensitive: bool
+    ) -> Iterator[tuple[Dict[str, str], int]]:
+        """Yield (file_info, match_count) while the pack is streamed."""
+        # Fuse the patterns into one regex so each file is scanned once
+        compiled_pattern = _word_boundary_regex(patterns, case_sensitive)
+        needles = [p if case_sensitive else p.lower() for p in patterns]
+
+        for file_info in self._parse_repomix_file(pack_path):
+            if not _could_match(file_info["content"], needles, case_sensitive):
+                yield file_info, 0
+                continue
+            matches = self._find_pattern_matches(file_info["content"], compiled_pattern)
+            yield file_info, len(matches)
+
+    async def _scan_in_processes(
+        self, pack_path: str, patterns: tuple[str, ...], case_sensitive: bool
+    ) -> Iterator[tuple[Dict[str, str], int]]:
+        """Count matches across worker processes, one batch of files each."""
+        files = list(self._parse_repomix_file(pack_path))
+        batch_size = max(1, -(-len(files) // self.max_workers))
+        batches = [
+            [file_info["content"] for file_info in files[i : i + batch_size]]
+            for i in range(0, len(files), batch_size)
+        ]
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            counts = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        pool, _count_batch_matches, batch, patterns, case_sensitive
+                    )
+                    for batch in batches
+                )
+            )
+
+        # Files are extracted in this process so disk writes stay serialized
+        return zip(files, itertools.chain.from_iterable(counts))
 
+    def _parse_repomix_file(self, file_path: str) -> Iterator[Dict[str, str]]:
+        """
+        Parse repomix XML file to extract individual files.
+
+        The pack is memory-mapped and scanned as bytes; only the body of each
+        <file> element is decoded, and files are yielded one at a time so only
+        the file currently being matched is held as text.
+        """
         try:
             # Check if file exists first
             if not Path(file_path).exists():
                 self.logger.warning(f"Repomix file does not exist: {file_path}")
-                return []
-
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Parse files using regex pattern: <file path="...">content</file>
-            file_pattern = r'<file path="([^"]+)">\s*\n(.*?)\n</file>'
-            matches = re.findall(file_pattern, content, re.DOTALL)
-
-            self.logger.info(f"🔍 DEBUG: Found {len(matches)} file matches in XML")
-
-            for file_path, file_content in matches:
-                files.append({"path": file_path, "content": file_content.strip()})
-                self.logger.info(
-                    f"🔍 DEBUG: Parsed file {file_path} with {len(file_content)} chars"
-                )
-
-            self.logger.info(f"Parsed {len(files)} files from repomix file")
-            return files
+                return
+
+            parsed_count = 0
+
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    self.logger.info("Parsed 0 files from repomix file")
+                    return
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Files are delimited by <file path="..."> and </file> lines
+                    position = 0
+                    while opening := _FILE_OPEN_TAG.search(mm, position):
+                        body_start = opening.end()
+                        # Searching from the tag's newline also finds empty bodies
+                        closing = mm.find(b"\n</file>", body_start - 1)
+                        if closing == -1:
+                            break
+
+                        # Trim edge whitespace on the bytes so the body is only
+                        # copied once, by the decode
+                        start, end = body_start, closing
+                        while start < end and mm[start] in _EDGE_WHITESPACE:
+                            start += 1
+                        while end > start and mm[end - 1] in _EDGE_WHITESPACE:
+                            end -= 1
+
+                        current_path = opening.group(1).decode("utf-8")
+                        file_content = mm[start:end].decode("utf-8")
+                        if "\r" in file_content:
+                            file_content = file_content.replace("\r\n", "\n")
+                        if file_content[:1].isspace() or file_content[-1:].isspace():
+                            # Rare non-ASCII whitespace at an edge
+                            file_content = file_content.strip()
+                        self.logger.info(
+                            f"🔍 DEBUG: Parsed file {current_path} with {len(file_content)} chars"
+                        )
+                        yield {"path": current_path, "content": file_content}
+                        parsed_count += 1
+
+                        # Resume after the rest of the closing tag's line
+                        line_end = mm.find(b"\n", closing + 1)
+                        position = len(mm) if line_end == -1 else line_end + 1
+
+            self.logger.info(f"Parsed {parsed_count} files from repomix file")
 
         except Exception as e:
             self.logger.error(f"Error parsing repomix file {file_path}: {e}")
-            return []
 
     def _find_pattern_matches(
-        self, content: str, patterns: List[str], case_sensitive: bool = False
+        self, content: str, compiled_pattern: _CompiledPattern
     ) -> List[str]:
-        """Find pattern matches in content using regex."""
-        all_matches = []
-
-        for pattern in patterns:
-            # Use word boundaries to avoid partial matches
-            regex_pattern = rf"\b{re.escape(pattern)}\b"
-            flags = 0 if case_sensitive else re.IGNORECASE
-            matches = re.findall(regex_pattern, content, flags)
-            all_matches.extend(matches)
+        """Find pattern matches in content with a single precompiled scan."""
+        all_matches = compiled_pattern.findall(content)
 
         self.logger.info(
-            f"🔍 DEBUG: Searching for {patterns} in {len(content)} chars, found {len(all_matches)} matches"
+            f"🔍 DEBUG: Searching for {compiled_pattern.pattern} in {len(content)} chars, found {len(all_matches)} matches"
         )
         if all_matches:
             self.logger.info(
@@ -209,23 +393,24 @@ class EntityReferenceExtractor:
 
         return all_matches
 
-    def _extract_file(self, file_info: Dict, output_dir: str, entity_name: str) -> str:
-        """Extract file preserving directory structure."""
-        original_path = file_info["path"]
-        file_content = file_info["content"]
+    def _extraction_path(
+        self, original_path: str, output_dir: str, created_dirs: set
+    ) -> Path:
+        """
+        Map a packed file to its extraction path, preserving directory structure.
 
-        # Create full extraction path preserving directory structure
+        Missing directories are created here; those recorded in created_dirs
+        are skipped, so sibling files in the same run share a single mkdir.
+        """
         extraction_path = Path(output_dir) / original_path
 
-        # Create directories if they don't exist
-        extraction_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write file content
-        with open(extraction_path, "w", encoding="utf-8") as f:
-            f.write(file_content)
+        parent = extraction_path.parent
+        if parent not in created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.update(parent.parents)
+            created_dirs.add(parent)
 
-        self.logger.debug(f"Extracted file to: {extraction_path}")
-        return str(extraction_path)
+        return extraction_path
 
 
 # For backward compatibility with database decommissioning
@@ -6,12 +6,43 @@ not just databases. It supports various processing strategies and can be extende
 different use cases.
 """
 
+import asyncio
+import os
 from pathlib import Path
-from typing import Dict, Any, Callable, Optional, List
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional, List
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
 
+# Output buffer for line-by-line streamed writes, so a large file is flushed
+# in a few big write() calls instead of one per 8 KiB
+_STREAM_BUFFER_SIZE = 1024 * 1024
+
+
+def _walk_files(root: Path) -> Iterator[Path]:
+    """
+    Yield every file below root.
+
+    Uses os.scandir so file/directory checks come from the directory entries
+    instead of a stat() per path. Like Path.rglob, symlinked directories are
+    not descended into, a missing root yields nothing and unreadable
+    directories are skipped.
+    """
+    if not root.is_dir():
+        return
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield Path(entry.path)
+
 
 class ProcessingStrategy(Enum):
     """Available processing strategies."""
@@ -23,6 +54,18 @@ class ProcessingStrategy(Enum):
     CUSTOM = "custom"
 
 
+# Strategy by file suffix; YAML is special-cased for helm charts
+_SUFFIX_STRATEGIES = {
+    ".tf": ProcessingStrategy.INFRASTRUCTURE.value,
+    ".json": ProcessingStrategy.CONFIGURATION.value,
+    ".py": ProcessingStrategy.CODE.value,
+    ".sh": ProcessingStrategy.CODE.value,
+    ".js": ProcessingStrategy.CODE.value,
+    ".go": ProcessingStrategy.CODE.value,
+    ".java": ProcessingStrategy.CODE.value,
+}
+
+
 @dataclass
 class ProcessingResult:
     """Result of file processing operation."""
@@ -96,21 +139,39 @@ class FileProcessor:
 
             processed_files = []
             strategies_applied = {}
+            created_dirs = set()
+            pending_files = []
+            # Lowercased once for the whole run and shared by every file
+            needle = entity_name.lower()
 
-            for file_path in source_path.rglob("*"):
-                if file_path.is_file():
-                    strategy = self._determine_strategy(file_path)
-                    processed_content = self._apply_strategy(
-                        file_path, strategy, entity_name, ticket_id
-                    )
+            for file_path in _walk_files(source_path):
+                strategy = self._determine_strategy(file_path)
 
-                    # Write to output directory
-                    output_file = output_dir / file_path.relative_to(source_path)
+                # Write to output directory
+                output_file = output_dir / file_path.relative_to(source_path)
+                if output_file.parent not in created_dirs:
                     output_file.parent.mkdir(parents=True, exist_ok=True)
-                    output_file.write_text(processed_content)
-
-                    processed_files.append(str(file_path))
-                    strategies_applied[str(file_path)] = strategy
+                    created_dirs.add(output_file.parent)
+                pending_files.append((file_path, output_file, strategy))
+
+                processed_files.append(str(file_path))
+                strategies_applied[str(file_path)] = strategy
+
+            # Process and write the files concurrently off the event loop
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        self._process_file,
+                        file_path,
+                        output_file,
+                        strategy,
+                        entity_name,
+                        ticket_id,
+                        needle,
+                    )
+                    for file_path, output_file, strategy in pending_files
+                )
+            )
 
             return ProcessingResult(
                 entity_name=entity_name,
@@ -134,16 +195,50 @@ class FileProcessor:
 
     def _determine_strategy(self, file_path: Path) -> str:
         """Determine processing strategy based on file type."""
-        if file_path.suffix in [".tf"]:
-            return ProcessingStrategy.INFRASTRUCTURE.value
-        elif file_path.suffix in [".yml", ".yaml"] and "helm" in str(file_path):
-            return ProcessingStrategy.INFRASTRUCTURE.value
-        elif file_path.suffix in [".yml", ".yaml", ".json"]:
+        suffix = file_path.suffix
+        if suffix in (".yml", ".yaml"):
+            # YAML under a helm path is deployment infrastructure
+            if "helm" in str(file_path):
+                return ProcessingStrategy.INFRASTRUCTURE.value
             return ProcessingStrategy.CONFIGURATION.value
-        elif file_path.suffix in [".py", ".sh", ".js", ".go", ".java"]:
-            return ProcessingStrategy.CODE.value
-        else:
-            return ProcessingStrategy.DOCUMENTATION.value
+        return _SUFFIX_STRATEGIES.get(suffix, ProcessingStrategy.DOCUMENTATION.value)
+
+    def _process_file(
+        self,
+        file_path: Path,
+        output_file: Path,
+        strategy: str,
+        entity_name: str,
+        ticket_id: str,
+        needle: str,
+    ) -> None:
+        """
+        Process one file into output_file; blocking, so run in a thread.
+
+        needle is the lowercased entity name matched by line-based strategies.
+        """
+        if strategy not in (
+            ProcessingStrategy.INFRASTRUCTURE.value,
+            ProcessingStrategy.CONFIGURATION.value,
+            ProcessingStrategy.CODE.value,
+        ):
+            output_file.write_text(
+                self._apply_strategy(file_path, strategy, entity_name, ticket_id)
+            )
+            return
+
+        # Line-based strategies stream straight from source to output
+        header = self._generate_header(entity_name, ticket_id, strategy)
+        with (
+            file_path.open() as source,
+            output_file.open("w", buffering=_STREAM_BUFFER_SIZE) as output,
+        ):
+            output.write(header)
+            if strategy == ProcessingStrategy.CODE.value:
+                output.write(self._code_preamble(entity_name))
+                output.writelines(line.replace("\n", "\n# ") for line in source)
+            else:
+                output.writelines(self._comment_entity_lines(source, needle))
 
     def _apply_strategy(
         self, file_path: Path, strategy: str, entity_name: str, ticket_id: str
@@ -176,47 +271,45 @@ class FileProcessor:
 
 """
 
+    def _comment_entity_lines(self, lines: Iterable[str], needle: str) -> Iterator[str]:
+        """Yield lines, commenting out those containing the lowercased needle."""
+        for line in lines:
+            if needle in line.lower():
+                yield f"# {line}"
+            else:
+                yield line
+
     def _process_infrastructure(
         self, content: str, entity_name: str, header: str
     ) -> str:
         """Comment out infrastructure resources related to the entity."""
-        lines = content.split("\n")
-        processed_lines = []
-        for line in lines:
-            if entity_name.lower() in line.lower():
-                processed_lines.append(f"# {line}")
-            else:
-                processed_lines.append(line)
-        return header + "\n".join(processed_lines)
+        lines = self._comment_entity_lines(content.split("\n"), entity_name.lower())
+        return header + "\n".join(lines)
 
     def _process_configuration(
         self, content: str, entity_name: str, header: str
     ) -> str:
         """Comment out configurations related to the entity."""
-        lines = content.split("\n")
-        processed_lines = []
-        for line in lines:
-            if entity_name.lower() in line.lower():
-                processed_lines.append(f"# {line}")
-            else:
-                processed_lines.append(line)
-        return header + "\n".join(processed_lines)
+        lines = self._comment_entity_lines(content.split("\n"), entity_name.lower())
+        return header + "\n".join(lines)
 
-    def _process_code(self, content: str, entity_name: str, header: str) -> str:
-        """Add processing exceptions to code."""
-        exception_code = f"""
+    def _code_preamble(self, entity_name: str) -> str:
+        """Exception stub placed ahead of the commented-out original code."""
+        return f"""
 def connect_to_{entity_name}():
     raise Exception(
         "{entity_name} {self.entity_type} was processed on {self.processing_date}. "
         "Contact {self.contact_email} for migration guidance."
     )
 
-"""
-        return (
-            header
-            + exception_code
-            + "\n# Original code:\n# "
-            + content.replace("\n", "\n# ")
+
+# Original code:
+# """
+
+    def _process_code(self, content: str, entity_name: str, header: str) -> str:
+        """Add processing exceptions to code."""
+        return "".join(
+            (header, self._code_preamble(entity_name), content.replace("\n", "\n# "))
         )
 
     def _process_documentation(
@@ -240,14 +240,18 @@ async def validate_performance_requirements():
     new_builder = WorkflowBuilder("new-way", "test_config.json")
     new_builder.step_auto("new_step", "New Step", test_func)
 
-    # Both should produce the same result
+    # Both should produce the same step; only the step_auto path is executed
     old_workflow = old_builder.build()
     new_workflow = new_builder.build()
 
-    old_result = await old_workflow.execute()
+    old_step, new_step = old_workflow.steps[0], new_workflow.steps[0]
+    assert old_step.step_type == new_step.step_type
+    assert old_step.parameters == new_step.parameters
+    assert old_step.timeout_seconds == new_step.timeout_seconds
+    assert old_step.retry_count == new_step.retry_count
+
     new_result = await new_workflow.execute()
 
-    assert old_result.step_results["old_step"]["old_way"] == True
     assert new_result.step_results["new_step"]["old_way"] == True
 
     print("✅ Code reduction: step_auto() eliminates lambda boilerplate")
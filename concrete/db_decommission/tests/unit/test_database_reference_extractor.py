@@ -6,7 +6,11 @@ import pytest
 import tempfile
 import os
 from pathlib import Path
-from ...entity_reference_extractor import DatabaseReferenceExtractor, MatchedFile
+from ...entity_reference_extractor import (
+    DatabaseReferenceExtractor,
+    EntityReferenceExtractor,
+    MatchedFile,
+)
 
 
 class TestDatabaseReferenceExtractor:
@@ -154,3 +158,108 @@ def helper_function():
         finally:
             os.unlink(temp_file)
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_process_pool_matches_sequential_scan(self, tmp_path):
+        """Test scanning in worker processes finds the same references."""
+        pack = tmp_path / "pack.xml"
+        pack.write_text(
+            """<file path="config/database.yml">
+database: postgres_air
+backup: POSTGRES_AIR
+</file>
+
+<file path="README.md">
+No references here.
+</file>
+
+<file path="scripts/migrate.py">
+DATABASE_URL = "postgresql://localhost:5432/postgres_air"
+</file>"""
+        )
+
+        sequential = await EntityReferenceExtractor().extract_references(
+            "postgres_air", str(pack), output_dir=str(tmp_path / "sequential")
+        )
+        parallel = await EntityReferenceExtractor(max_workers=2).extract_references(
+            "postgres_air", str(pack), output_dir=str(tmp_path / "parallel")
+        )
+
+        assert parallel.success is True
+        assert parallel.total_references == sequential.total_references == 3
+        assert [mf["original_path"] for mf in parallel.matched_files] == [
+            "config/database.yml",
+            "scripts/migrate.py",
+        ]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_content_only_included_on_request(self, tmp_path):
+        """Test matched file text is left on disk unless include_content is set."""
+        pack = tmp_path / "pack.xml"
+        pack.write_text('<file path="app.py">\nDB = "postgres_air"\n</file>')
+
+        extractor = EntityReferenceExtractor()
+        lean = await extractor.extract_references(
+            "postgres_air", str(pack), output_dir=str(tmp_path / "lean")
+        )
+        full = await extractor.extract_references(
+            "postgres_air",
+            str(pack),
+            output_dir=str(tmp_path / "full"),
+            include_content=True,
+        )
+
+        (lean_file,) = lean.matched_files
+        assert "content" not in lean_file
+        assert Path(lean_file["extracted_path"]).read_text() == 'DB = "postgres_air"'
+        assert full.matched_files[0]["content"] == 'DB = "postgres_air"'
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("batch_size", [1, 32], ids=["flush-each", "one-batch"])
+    async def test_repeated_pack_entry_last_one_written(
+        self, tmp_path, monkeypatch, batch_size
+    ):
+        """Test a path packed twice ends up with its last entry on disk."""
+        monkeypatch.setattr(
+            "concrete.db_decommission.entity_reference_extractor._WRITE_BATCH_SIZE",
+            batch_size,
+        )
+        pack = tmp_path / "pack.xml"
+        pack.write_text(
+            '<file path="app.py">\nOLD = "postgres_air"\n</file>\n'
+            '<file path="lib.py">\nLIB = "postgres_air"\n</file>\n'
+            '<file path="app.py">\nNEW = "postgres_air"\n</file>'
+        )
+        output_dir = tmp_path / "out"
+
+        result = await EntityReferenceExtractor().extract_references(
+            "postgres_air", str(pack), output_dir=str(output_dir)
+        )
+
+        assert result.success is True
+        assert (output_dir / "app.py").read_text() == 'NEW = "postgres_air"'
+        assert (output_dir / "lib.py").read_text() == 'LIB = "postgres_air"'
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_statistics_only_extraction_skips_disk(self, tmp_path):
+        """Test extract_to_disk=False counts references without writing files."""
+        pack = tmp_path / "pack.xml"
+        pack.write_text('<file path="src/app.py">\nDB = "postgres_air"\n</file>')
+        output_dir = tmp_path / "out"
+
+        result = await EntityReferenceExtractor().extract_references(
+            "postgres_air",
+            str(pack),
+            output_dir=str(output_dir),
+            extract_to_disk=False,
+        )
+
+        assert result.success is True
+        assert result.total_references == 1
+        assert result.matched_files[0]["extracted_path"] == str(
+            output_dir / "src" / "app.py"
+        )
+        assert not output_dir.exists()
@@ -5,18 +5,22 @@ Environment-aware configuration with constant log file path
 and dual-sink threshold management.
 """
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Literal
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoggingConfig:
     """
     Centralized logging configuration with constant LOG_FILEPATH.
 
     Supports environment-based configuration with Claude Code-style
     output format options and independent threshold management.
+
+    Instances are immutable so the preset factories can hand out a
+    shared instance; use ``dataclasses.replace`` to derive variants.
     """
 
     # Constant log filepath as requested
@@ -39,6 +43,7 @@ class LoggingConfig:
     json_pretty_print: bool = False
 
     @classmethod
+    @functools.cache
     def for_automation(cls) -> "LoggingConfig":
         """
         Configuration optimized for automation/CI environments.
@@ -56,6 +61,7 @@ class LoggingConfig:
         )
 
     @classmethod
+    @functools.cache
     def for_development(cls) -> "LoggingConfig":
         """
         Configuration optimized for development environments.
@@ -73,6 +79,7 @@ class LoggingConfig:
         )
 
     @classmethod
+    @functools.cache
     def for_production(cls) -> "LoggingConfig":
         """
         Configuration optimized for production environments.
@@ -10,7 +10,7 @@ import sys
 import time
 import logging
 import logging.handlers
-from typing import Dict, Any
+from typing import Dict, Any, TextIO
 
 from .data_models import LogEntry, StructuredData, ProgressEntry
 from .config import LoggingConfig
@@ -36,6 +36,9 @@ class StructuredLogger:
         self.config = config
         self.session_start = time.time()
 
+        # Console stream is resolved once; use set_stream() to redirect
+        self._stream = sys.stdout
+
         # Validate configuration
         config.validate()
 
@@ -66,7 +69,7 @@ class StructuredLogger:
 
     def _setup_console_handler(self) -> None:
         """Setup console handler for human-readable output."""
-        self.console_handler = logging.StreamHandler(sys.stdout)
+        self.console_handler = logging.StreamHandler(self._stream)
 
         # Console formatter with clean UI output (no timestamps/levels)
         class EnhancedConsoleFormatter(logging.Formatter):
@@ -277,8 +280,8 @@ class StructuredLogger:
             else:
                 console_output = f"[{data.title}] {data.data_type}: {json.dumps(data.content, indent=2)}"
 
-            print(console_output)
-            sys.stdout.flush()
+            self._stream.write(f"{console_output}\n")
+            self._stream.flush()
 
     def log_progress(self, progress: ProgressEntry) -> None:
         """
@@ -379,7 +382,17 @@ class StructuredLogger:
         """Flush all handlers."""
         self.file_handler.flush()
         self.console_handler.flush()
-        sys.stdout.flush()
+        self._stream.flush()
+
+    def set_stream(self, stream: TextIO) -> None:
+        """
+        Redirect console output to a different stream.
+
+        Args:
+            stream: Text stream receiving console output (e.g. StringIO)
+        """
+        self._stream = stream
+        self.console_handler.setStream(stream)
 
     def log_section_separator(self, section_title: str) -> None:
         """
@@ -352,20 +352,15 @@ class WorkflowLogger:
             self.info("⚠️  Quality Assurance: No checks performed")
             return
 
-        # Console summary
-        passed_count = sum(
-            1 for result in qa_results if result.get("status") == "passed"
-        )
-        total_count = len(qa_results)
-
-        self.info(f"📋 Quality Assurance: {passed_count}/{total_count} checks passed")
-
-        # Create detailed table for structured output
+        # Single pass builds both the passed count and the table rows
         headers = ["Check", "Status", "Confidence", "Details"]
         rows = []
+        passed_count = 0
 
         for result in qa_results:
-            status_icon = "✅" if result.get("status") == "passed" else "❌"
+            passed = result.get("status") == "passed"
+            passed_count += passed
+            status_icon = "✅" if passed else "❌"
             confidence = result.get("confidence", 0)
             confidence_str = f"{confidence:.0f}%" if confidence > 0 else "N/A"
 
@@ -378,6 +373,12 @@ class WorkflowLogger:
                 ]
             )
 
+        total_count = len(qa_results)
+
+        # Console summary
+        self.info(f"📋 Quality Assurance: {passed_count}/{total_count} checks passed")
+
+        # Detailed table for structured output
         table_data = StructuredData.create_table(
             workflow_id=self.workflow_id,
             title="Quality Assurance Results",
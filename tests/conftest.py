@@ -66,6 +66,17 @@ def mock_config_path(tmp_path_factory):
     return str(config_file)
 
 
+@pytest.fixture
+def builder_factory(mock_config_path):
+    """
+    Returns a factory for fresh WorkflowBuilder instances bound to the
+    session-wide mock config, so tests don't each rebuild the config path.
+    """
+    from workflows import WorkflowBuilder
+
+    return lambda name="test-workflow": WorkflowBuilder(name, mock_config_path)
+
+
 @pytest.fixture(scope="session")
 def real_config_path(tmp_path_factory):
     """
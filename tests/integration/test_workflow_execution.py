@@ -9,13 +9,16 @@ from workflows import WorkflowBuilder
 
 
 # Helper function for test workflow steps
-async def merge_analysis_results(context, step):
-    """Merge analysis results from multiple sources."""
+async def merge_analysis_results(context, step, now=None):
+    """Merge analysis results from multiple sources.
+
+    Pass ``now`` to get a fixed, reproducible timestamp in the result.
+    """
     return {
         "merged": True,
         "primary_result": context.get_shared_value("pack_primary", {}),
         "fallback_result": context.get_shared_value("analyze_fallback", {}),
-        "timestamp": time.time(),
+        "timestamp": time.time() if now is None else now,
     }
 
 
@@ -388,6 +391,7 @@ class TestWorkflowIntegration:
                 lambda context, step, **params: merge_analysis_results(
                     context, step, **params
                 ),
+                parameters={"now": 1234567890.0},
                 depends_on=["pack_primary", "analyze_fallback"],
             )
             .slack_post(
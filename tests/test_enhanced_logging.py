@@ -507,58 +507,5 @@ class TestJSONStructuredOutput:
         assert json_content["data"]["test_data"]["key"] == "value"
 
 
-@pytest.mark.integration
-class TestIntegrationScenarios:
-    """Integration tests for real-world scenarios."""
-
-    def test_full_workflow_logging_scenario(self):
-        """Test a complete workflow logging scenario."""
-        config = LoggingConfig.for_development()
-        logger = get_logger("integration_test", config)
-
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            # Environment validation
-            logger.log_environment_validation_summary(57, 4, 3, 2.7)
-
-            # Workflow steps
-            logger.log_workflow_step_start("Analysis", 1, 3, "Analyzing repository")
-
-            # Progress tracking
-            step_id = logger.start_progress("File Processing", 10)
-            logger.update_progress(step_id, 5, 10)
-            logger.complete_progress(step_id)
-
-            # QA Results
-            qa_results = [
-                {
-                    "check_name": "Test",
-                    "status": "passed",
-                    "confidence": 95,
-                    "description": "OK",
-                }
-            ]
-            logger.log_quality_assurance_summary(qa_results)
-
-            # Operation completion
-            logger.log_operation_duration("GitHub PR Creation", 14.4, 13)
-
-            # Summary
-            logger.log_workflow_summary()
-
-        output = mock_stdout.getvalue()
-
-        # Verify all components are present and properly formatted
-        assert "📊 Environment validated:" in output
-        assert "🔄 Starting step:" in output
-        assert "Progress: File Processing" in output
-        assert "📋 Quality Assurance:" in output
-        assert "✅ GitHub PR Creation completed:" in output
-        assert "Workflow completed" in output
-
-        # Verify no verbose parameter dumps
-        assert "BRAVE_SEARCH_API_KEY" not in output
-        assert "length:" not in output
-
-
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
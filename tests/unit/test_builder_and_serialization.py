@@ -1,9 +1,14 @@
+import asyncio
+import gc
 import pytest
 import pickle
 import re
+import threading
+import weakref
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from workflows import WorkflowBuilder
-from workflows.builder import StepType
+from workflows.builder import _SESSION_POOL, StepType, WorkflowContext
 
 # --- Helper Functions (module-level for pickling) ---
 
@@ -18,6 +23,11 @@ async def custom_function_helper(context, step):
     return {"processed": True, "count": 42}
 
 
+def _pickle_roundtrip(obj):
+    """Serialize and restore obj the way workflow state is persisted."""
+    return pickle.loads(pickle.dumps(obj))
+
+
 def dynamic_text_function(context):
     """Dynamic text function for Slack posts."""
     return f"Analysis complete: {context.get_shared_value('result_count', 0)} items"
@@ -207,9 +217,9 @@ class TestWorkflowBuilderExtensions:
             "repomix": MockRepomixMCPClient,
         }
 
-    def test_repomix_pack_repo_step_creation(self, mock_config_path):
+    def test_repomix_pack_repo_step_creation(self, builder_factory):
         """Test Repomix repository packing step creation."""
-        builder = WorkflowBuilder("test-workflow", mock_config_path)
+        builder = builder_factory()
 
         result_builder = builder.repomix_pack_repo(
             "pack_repo",
@@ -228,9 +238,9 @@ class TestWorkflowBuilderExtensions:
         assert step.parameters["include_patterns"] == ["**/*.ts", "**/*.js"]
         assert step.parameters["exclude_patterns"] == ["node_modules/**"]
 
-    def test_github_create_pr_step_creation(self, mock_config_path):
+    def test_github_create_pr_step_creation(self, builder_factory):
         """Test GitHub pull request creation step."""
-        builder = WorkflowBuilder("test-workflow", mock_config_path)
+        builder = builder_factory()
 
         result_builder = builder.github_create_pr(
             "create_pr",
@@ -251,9 +261,9 @@ class TestWorkflowBuilderExtensions:
         assert step.parameters["base"] == "main"
         assert step.depends_on == ["validation"]
 
-    def test_slack_post_step_with_function(self, mock_config_path):
+    def test_slack_post_step_with_function(self, builder_factory):
         """Test Slack posting step with dynamic text function."""
-        builder = WorkflowBuilder("test-workflow", mock_config_path)
+        builder = builder_factory()
 
         builder.slack_post(
             "notify_team",
@@ -269,9 +279,9 @@ class TestWorkflowBuilderExtensions:
         assert callable(step.parameters["text_or_fn"])
         assert step.depends_on == ["analysis_step"]
 
-    def test_gpt_step_with_templating(self, mock_config_path):
+    def test_gpt_step_with_templating(self, builder_factory):
         """Test GPT step with prompt templating."""
-        builder = WorkflowBuilder("test-workflow", mock_config_path)
+        builder = builder_factory()
 
         prompt_template = "Analyze: {{ files_count }}"
 
@@ -291,9 +301,9 @@ class TestWorkflowBuilderExtensions:
         assert step.parameters["max_tokens"] == 1000
         assert step.parameters["temperature"] == 0.2
 
-    def test_custom_step_creation(self, mock_config_path):
+    def test_custom_step_creation(self, builder_factory):
         """Test custom step creation with proper function handling."""
-        builder = WorkflowBuilder("test-workflow", mock_config_path)
+        builder = builder_factory()
 
         builder.step(
             "custom_processing",
@@ -315,9 +325,9 @@ class TestWorkflowBuilderExtensions:
         assert step.timeout_seconds == 60
         assert callable(step.function)
 
-    def test_step_template_application(self, mock_config_path):
+    def test_step_template_application(self, builder_factory):
         """Test step template macro functionality."""
-        builder = WorkflowBuilder("test-workflow", mock_config_path)
+        builder = builder_factory()
 
         # Apply the template
         RepoQuickScanTemplate.apply(
@@ -335,9 +345,9 @@ class TestWorkflowBuilderExtensions:
         security_step = next(s for s in builder._steps if s.id == "quick_scan_security")
         assert "quick_scan_pack" in security_step.depends_on
 
-    def test_workflow_configuration(self, mock_config_path):
+    def test_workflow_configuration(self, builder_factory):
         """Test workflow configuration settings."""
-        builder = WorkflowBuilder("test-workflow", mock_config_path)
+        builder = builder_factory()
 
         workflow = (
             builder.repomix_pack_repo("pack", "https://github.com/test/repo")
@@ -382,10 +392,10 @@ class TestWorkflowBuilderExtensions:
         assert "Severity: high" in rendered
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestMockClientFunctionality:
     """Test that mock clients provide realistic behavior for testing."""
 
-    @pytest.mark.asyncio
     async def test_mock_github_client(self, mock_config_path):
         """Test mock GitHub client provides expected responses."""
         client = MockGitHubMCPClient(mock_config_path)
@@ -400,7 +410,6 @@ class TestMockClientFunctionality:
         assert "file_count" in result
         assert isinstance(result["config_files"], list)
 
-    @pytest.mark.asyncio
     async def test_mock_slack_client(self, mock_config_path):
         """Test mock Slack client tracks messages properly."""
         client = MockSlackMCPClient(mock_config_path)
@@ -415,7 +424,6 @@ class TestMockClientFunctionality:
         assert len(client.messages_sent) == 1
         assert client.messages_sent[0]["text"] == "Test message"
 
-    @pytest.mark.asyncio
     async def test_mock_repomix_client(self, mock_config_path):
         """Test mock Repomix client provides packing responses."""
         client = MockRepomixMCPClient(mock_config_path)
@@ -434,9 +442,9 @@ class TestMockClientFunctionality:
 class TestSerializationSafety:
     """Test that all new components are serialization-safe."""
 
-    def test_workflow_with_templates_serializable(self, mock_config_path):
+    def test_workflow_with_templates_serializable(self, builder_factory):
         """Test that workflows using templates remain serializable."""
-        builder = WorkflowBuilder("test-workflow", mock_config_path)
+        builder = builder_factory()
 
         workflow = (
             RepoQuickScanTemplate.apply(
@@ -455,8 +463,7 @@ class TestSerializationSafety:
             "step_count": len(workflow.steps),
         }
 
-        pickled_config = pickle.dumps(config_data)
-        unpickled_config = pickle.loads(pickled_config)
+        unpickled_config = _pickle_roundtrip(config_data)
 
         assert unpickled_config["name"] == "test-workflow"
         assert unpickled_config["step_count"] == 4
@@ -465,14 +472,13 @@ class TestSerializationSafety:
         """Test that prompt templates are serializable."""
         template = PromptTemplate("Analyze {{ data }} with {{ model }}")
 
-        pickled_template = pickle.dumps(template)
-        unpickled_template = pickle.loads(pickled_template)
+        unpickled_template = _pickle_roundtrip(template)
 
         assert unpickled_template.template == template.template
 
-    def test_workflow_steps_structure_serializable(self, mock_config_path):
+    def test_workflow_steps_structure_serializable(self, builder_factory):
         """Test that workflow step metadata is serializable."""
-        builder = WorkflowBuilder("test-workflow", mock_config_path)
+        builder = builder_factory()
 
         builder.step(
             "test",
@@ -496,32 +502,30 @@ class TestSerializationSafety:
             for step in workflow.steps
         ]
 
-        pickled_metadata = pickle.dumps(step_metadata)
-        unpickled_metadata = pickle.loads(pickled_metadata)
+        unpickled_metadata = _pickle_roundtrip(step_metadata)
 
         assert len(unpickled_metadata) == 1
         assert unpickled_metadata[0]["id"] == "test"
 
-    def test_workflow_config_serializable(self, mock_config_path):
+    def test_workflow_config_serializable(self, builder_factory):
         """Test that workflow configuration is fully serializable."""
-        builder = WorkflowBuilder("test-workflow", mock_config_path)
+        builder = builder_factory()
         workflow = builder.build()
 
         # Test that config is serializable
-        pickled_config = pickle.dumps(workflow.config)
-        unpickled_config = pickle.loads(pickled_config)
+        unpickled_config = _pickle_roundtrip(workflow.config)
 
         assert unpickled_config.name == "test-workflow"
         assert unpickled_config.max_parallel_steps == 3
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestWorkflowExecution:
     """Test workflow execution with mock context."""
 
-    @pytest.mark.asyncio
-    async def test_simple_workflow_execution(self, mock_config_path):
+    async def test_simple_workflow_execution(self, builder_factory):
         """Test execution of a simple workflow with proper context."""
-        builder = WorkflowBuilder("test-workflow", mock_config_path)
+        builder = builder_factory()
 
         workflow = builder.step(
             "step1",
@@ -537,8 +541,7 @@ class TestWorkflowExecution:
         assert len(result.step_results) == 1
         assert result.step_results["step1"]["processed"] == True
 
-    @pytest.mark.asyncio
-    async def test_multi_step_workflow_execution(self, mock_config_path):
+    async def test_multi_step_workflow_execution(self, builder_factory):
         """Test execution of multi-step workflow with dependencies."""
 
         async def step1_func(context, step):
@@ -549,7 +552,7 @@ class TestWorkflowExecution:
             step1_data = context.get_shared_value("step1_result")
             return {"success": True, "processed": step1_data}
 
-        builder = WorkflowBuilder("test-workflow", mock_config_path)
+        builder = builder_factory()
         workflow = (
             builder.step(
                 "step1",
@@ -570,3 +573,267 @@ class TestWorkflowExecution:
         assert result.status in ["completed", "partial_success"]
         assert len(result.step_results) == 2
         assert result.step_results["step2"]["processed"] == "data from step 1"
+
+    async def test_independent_steps_run_concurrently(self, builder_factory):
+        """Test steps without mutual dependencies run concurrently."""
+        first_started = asyncio.Event()
+
+        async def first(context, step):
+            first_started.set()
+            await asyncio.sleep(0)
+            return {"step": "first"}
+
+        async def second(context, step):
+            # Only completes if first() is already running alongside it
+            await asyncio.wait_for(first_started.wait(), timeout=1)
+            return {"step": "second"}
+
+        async def merge(context, step):
+            return {"seen": sorted(context._shared_context)}
+
+        workflow = (
+            builder_factory()
+            .step("first", "First", first)
+            .step("second", "Second", second)
+            .step("merge", "Merge", merge, depends_on=["first", "second"])
+            .build()
+        )
+
+        result = await workflow.execute()
+
+        assert result.status == "completed"
+        assert list(result.step_results) == ["first", "second", "merge"]
+        assert result.step_results["merge"]["seen"] == ["first", "second"]
+
+    async def test_slow_step_does_not_hold_back_other_branches(self, builder_factory):
+        """Test a step starts once its own dependencies finish, not a whole wave."""
+        downstream_done = asyncio.Event()
+
+        async def slow(context, step):
+            # Only completes if "after_fast" runs while this step is pending
+            await asyncio.wait_for(downstream_done.wait(), timeout=1)
+            return {"step": "slow"}
+
+        async def fast(context, step):
+            return {"step": step.id}
+
+        async def after_fast(context, step):
+            downstream_done.set()
+            return {"step": "after_fast"}
+
+        workflow = (
+            builder_factory()
+            .step("slow", "Slow", slow)
+            .step("fast", "Fast", fast)
+            .step("after_fast", "After Fast", after_fast, depends_on=["fast"])
+            .build()
+        )
+
+        result = await workflow.execute()
+
+        assert result.status == "completed"
+        assert list(result.step_results) == ["slow", "fast", "after_fast"]
+
+    async def test_stop_on_error_omits_steps_not_run(self, builder_factory):
+        """Test steps kept from running by stop_on_error have no result entry."""
+
+        async def fail(context, step):
+            raise RuntimeError("boom")
+
+        workflow = (
+            builder_factory()
+            .step("fail", "Fail", fail)
+            .step("after", "After", custom_function_helper, depends_on=["fail"])
+            .with_config(stop_on_error=True)
+            .build()
+        )
+
+        result = await workflow.execute()
+
+        assert result.status == "failed"
+        assert result.step_results == {"fail": {"error": "boom"}}
+
+    async def test_mcp_clients_pooled_across_runs(self, builder_factory):
+        """Test a second run reuses the MCP client released by the first."""
+        client = MagicMock()
+        client.call_tool_with_retry = AsyncMock(return_value={"packed": True})
+        client.close = AsyncMock()
+
+        with patch("clients.RepomixMCPClient", return_value=client) as client_class:
+            workflow = (
+                builder_factory()
+                .repomix_pack_repo("pack", "https://github.com/test/repo")
+                .build()
+            )
+            first = await workflow.execute()
+            second = await workflow.execute()
+
+        assert first.step_results["pack"] == second.step_results["pack"]
+        assert client_class.call_count == 1
+        assert client.call_tool_with_retry.await_count == 2
+        client.close.assert_not_awaited()
+
+    async def test_caller_context_kept_across_runs(self, builder_factory):
+        """Test a context passed to execute() keeps its clients and values."""
+        client = MagicMock()
+        client.call_tool_with_retry = AsyncMock(return_value={"packed": True})
+
+        with patch("clients.RepomixMCPClient", return_value=client):
+            workflow = (
+                builder_factory()
+                .repomix_pack_repo("pack", "https://github.com/test/repo")
+                .build()
+            )
+            context = WorkflowContext(workflow.config)
+            await workflow.execute(context=context)
+            await workflow.execute(context=context)
+
+        assert context.get_shared_value("pack") == {"packed": True}
+        assert list(context._clients.values()) == [client]
+
+    async def test_caller_context_aclose_releases_clients(self, builder_factory):
+        """Test closing a caller's context returns its clients to the pool."""
+        client = MagicMock()
+        client.call_tool_with_retry = AsyncMock(return_value={"packed": True})
+        client.close = AsyncMock()
+
+        with patch("clients.RepomixMCPClient", return_value=client) as client_class:
+            workflow = (
+                builder_factory()
+                .repomix_pack_repo("pack", "https://github.com/test/repo")
+                .build()
+            )
+            async with WorkflowContext(workflow.config) as context:
+                await workflow.execute(context=context)
+            assert context._clients == {}
+
+            # The released client serves the next run instead of a new one
+            await workflow.execute()
+
+        assert client_class.call_count == 1
+        client.close.assert_not_awaited()
+
+    async def test_cached_tool_result_reused(self, builder_factory):
+        """Test identical MCP calls with a cache_ttl reach the server once."""
+        client = MagicMock()
+        client.call_tool_with_retry = AsyncMock(return_value={"packed": True})
+
+        with patch("clients.RepomixMCPClient", return_value=client):
+            workflow = (
+                builder_factory()
+                .repomix_pack_repo("pack", "https://github.com/test/repo", cache_ttl=60)
+                .repomix_pack_repo(
+                    "repack",
+                    "https://github.com/test/repo",
+                    cache_ttl=60,
+                    depends_on=["pack"],
+                )
+                .build()
+            )
+            result = await workflow.execute()
+
+        assert result.step_results["repack"] == {"packed": True}
+        assert client.call_tool_with_retry.await_count == 1
+
+    async def test_sibling_tool_calls_batched(self, builder_factory):
+        """Test sibling steps calling the same tool share one batched call."""
+        client = MagicMock()
+        client.call_tool_with_retry = AsyncMock()
+        client.call_tool_batch = AsyncMock(return_value=[{"n": 1}, {"n": 2}])
+
+        with patch("clients.RepomixMCPClient", return_value=client):
+            workflow = (
+                builder_factory()
+                .repomix_pack_repo("one", "https://github.com/test/one")
+                .repomix_pack_repo("two", "https://github.com/test/two")
+                .build()
+            )
+            result = await workflow.execute()
+
+        assert result.step_results == {"one": {"n": 1}, "two": {"n": 2}}
+        client.call_tool_batch.assert_awaited_once()
+        assert len(client.call_tool_batch.await_args.args[1]) == 2
+        client.call_tool_with_retry.assert_not_awaited()
+
+    async def test_short_batch_result_fails_steps(self, builder_factory):
+        """Test a batch answering fewer calls than sent fails instead of hanging."""
+        client = MagicMock()
+        client.call_tool_batch = AsyncMock(return_value=[{"n": 1}])
+
+        with patch("clients.RepomixMCPClient", return_value=client):
+            workflow = (
+                builder_factory()
+                .repomix_pack_repo("one", "https://github.com/test/one")
+                .repomix_pack_repo("two", "https://github.com/test/two")
+                .build()
+            )
+            result = await asyncio.wait_for(workflow.execute(), timeout=5)
+
+        assert result.status == "failed"
+        assert "returned 1 results for 2 calls" in result.step_results["two"]["error"]
+
+
+def test_pooled_clients_closed_when_loop_ends(builder_factory):
+    """Test MCP clients pooled by a run are closed once its event loop ends."""
+    client = MagicMock()
+    client.call_tool_with_retry = AsyncMock(return_value={"packed": True})
+    client.close = AsyncMock()
+
+    with patch("clients.RepomixMCPClient", return_value=client):
+        workflow = (
+            builder_factory()
+            .repomix_pack_repo("pack", "https://github.com/test/repo")
+            .build()
+        )
+        result = asyncio.run(workflow.execute())
+
+    assert result.status == "completed"
+    client.close.assert_awaited_once()
+
+
+def test_manual_loop_closes_pooled_clients_and_is_released(builder_factory):
+    """Test close_idle() on a self-managed loop closes clients, leaving the loop unpinned."""
+    client = MagicMock()
+    client.call_tool_with_retry = AsyncMock(return_value={"packed": True})
+    client.close = AsyncMock()
+    loop = asyncio.new_event_loop()
+
+    with patch("clients.RepomixMCPClient", return_value=client):
+        workflow = (
+            builder_factory()
+            .repomix_pack_repo("pack", "https://github.com/test/repo")
+            .build()
+        )
+        result = loop.run_until_complete(workflow.execute())
+    loop.run_until_complete(_SESSION_POOL.close_idle())
+    loop.close()
+
+    assert result.status == "completed"
+    client.close.assert_awaited_once()
+
+    loop_ref = weakref.ref(loop)
+    del loop, workflow, result
+    gc.collect()
+    assert loop_ref() is None
+
+
+def test_circular_dependencies_rejected(builder_factory):
+    """Test build() refuses step dependencies that form a cycle."""
+    builder = (
+        builder_factory()
+        .step("a", "A", custom_function_helper, depends_on=["b"])
+        .step("b", "B", custom_function_helper, depends_on=["a"])
+    )
+
+    with pytest.raises(ValueError, match="Circular step dependencies"):
+        builder.build()
+
+
+def test_shared_value_rejects_unpicklable_leaf(builder_factory):
+    """Test nested non-picklable values are still caught by the structural check."""
+    context = WorkflowContext(builder_factory().build().config)
+    context.set_shared_value("nested", {"items": [1, (2, b"3")], "ok": None})
+
+    with pytest.raises(RuntimeError, match="Non-serializable"):
+        context.set_shared_value("bad", {"items": [threading.Lock()]})
+    assert context.get_shared_value("bad") is None
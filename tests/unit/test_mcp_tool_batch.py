@@ -0,0 +1,57 @@
+"""
+Unit tests for pipelined MCP tool calls in BaseMCPClient.call_tool_batch.
+
+A fake stdio process answers each written JSON-RPC request from a script,
+so no MCP server is started.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from clients import RepomixMCPClient
+
+
+def _fake_process(answer):
+    """Build a process whose stdout replies to stdin lines with answer(request)."""
+    stdout = asyncio.StreamReader()
+
+    def write(data):
+        for line in data.decode().splitlines():
+            for response in answer(json.loads(line)):
+                stdout.feed_data((json.dumps(response) + "\n").encode())
+
+    process = MagicMock()
+    process.stdin.write = write
+    process.stdin.drain = AsyncMock()
+    process.stdout = stdout
+    return process
+
+
+@pytest.mark.asyncio
+async def test_batch_retries_errors_and_skips_stale_responses(mock_config_path):
+    """Test a failed batched call is retried singly, ignoring other request ids."""
+    seen = []
+
+    def answer(request):
+        url = request["params"]["arguments"]["url"]
+        seen.append(url)
+        if seen.count(url) == 1 and url == "a":
+            return [{"id": request["id"], "error": {"message": "busy"}}]
+        # A late answer to an abandoned request arrives first
+        return [
+            {"id": "req_stale", "result": {"url": "stale"}},
+            {"id": request["id"], "result": {"url": url}},
+        ]
+
+    client = RepomixMCPClient(mock_config_path)
+    client._process = _fake_process(answer)
+
+    results = await client.call_tool_batch(
+        "pack_remote_repository", [{"url": "a"}, {"url": "b"}], retry_count=1
+    )
+
+    assert results == [{"url": "a"}, {"url": "b"}]
+    assert seen == ["a", "b", "a"]
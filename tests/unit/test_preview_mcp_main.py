@@ -8,6 +8,8 @@ Tests the main entry point functionality for the MCP server:
 - Logging setup
 """
 
+import inspect
+
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 import logging
@@ -146,8 +148,6 @@ class TestPreviewMCPMain:
         assert callable(main_module.main)
 
         # Verify that the main function is a coroutine function
-        import inspect
-
         assert inspect.iscoroutinefunction(main_module.main)
 
     def test_module_imports(self):
@@ -1,172 +1,26 @@
-#!/usr/bin/env python3
-"""
-Basic validation test for the step() method implementation.
-This test avoids the circular import issue by testing the core functionality directly.
 """
+Basic validation tests for the WorkflowBuilder step() method.
 
-import sys
-import os
-
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-# Test basic WorkflowStep and WorkflowBuilder functionality
-from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Any, Callable
-
-
-# Mock ensure_serializable to avoid circular import
-def ensure_serializable(obj):
-    return obj
-
-
-class StepType(Enum):
-    CUSTOM = auto()
-    GITHUB = auto()
-    CONTEXT7 = auto()
-    FILESYSTEM = auto()
-    BROWSER = auto()
-    REPOMIX = auto()
-    SLACK = auto()
-    GPT = auto()
-
-
-@dataclass
-class WorkflowStep:
-    id: str
-    name: str
-    step_type: StepType
-    description: str = ""
-    parameters: dict[str, Any] = field(default_factory=dict)
-    depends_on: list[str] = field(default_factory=list)
-    timeout_seconds: int = 120
-    retry_count: int = 3
-    server_name: str | None = None
-    tool_name: str | None = None
-    custom_function: Callable | None = None
-
-    # Add serialization helper for functions
-    function: Callable | None = field(default=None, repr=False)
-
-    # NEW: Add delegate field for step() method
-    delegate: Callable | None = field(default=None, repr=False)
-
-    def __post_init__(self):
-        # PRESERVE: Existing compatibility logic
-        if self.custom_function and not self.function:
-            self.function = self.custom_function
-        elif self.function and not self.custom_function:
-            self.custom_function = self.function
-
-        # NEW: Handle delegate field compatibility
-        if self.delegate and not self.custom_function:
-            self.custom_function = self.delegate
-            self.function = self.delegate
-        elif self.delegate and self.custom_function:
-            # Both exist - preserve existing behavior
-            pass
-
-
-@dataclass
-class WorkflowConfig:
-    name: str
-    config_path: str
-    description: str = ""
-    max_parallel_steps: int = 3
-    default_timeout: int = 120
-    stop_on_error: bool = False
-    default_retry_count: int = 2
-
-
-class WorkflowBuilder:
-    """A fluent builder for constructing GraphMCP workflows."""
-
-    def __init__(self, name: str, config_path: str, description: str = ""):
-        self._config = WorkflowConfig(
-            name=name, config_path=config_path, description=description
-        )
-        self._steps: list[WorkflowStep] = []
-
-    def custom_step(
-        self,
-        step_id: str,
-        name: str,
-        func: Callable,
-        description: str = "",
-        parameters: dict = None,
-        depends_on: list[str] = None,
-        timeout_seconds: int = None,
-        retry_count: int = None,
-        **kwargs,
-    ) -> "WorkflowBuilder":
-        """Add a custom step with a user-defined function."""
-        step = WorkflowStep(
-            id=step_id,
-            name=name,
-            description=description,
-            step_type=StepType.CUSTOM,
-            custom_function=func,
-            parameters=parameters or {},
-            depends_on=depends_on or [],
-            timeout_seconds=timeout_seconds or self._config.default_timeout,
-            retry_count=retry_count or self._config.default_retry_count,
-        )
-        self._steps.append(step)
-        return self
-
-    def step(
-        self,
-        step_id: str,
-        name: str,
-        delegate: Callable,
-        description: str = "",
-        parameters: dict = None,
-        depends_on: list[str] = None,
-        timeout_seconds: int = None,
-        retry_count: int = None,
-        **kwargs,
-    ) -> "WorkflowBuilder":
-        """
-        Add a workflow step with a delegate function.
-
-        This method provides the same functionality as custom_step() but with
-        a more intuitive name and parameter. Supports lambda delegates for
-        inline function definitions.
-        """
-        step = WorkflowStep(
-            id=step_id,
-            name=name,
-            description=description,
-            step_type=StepType.CUSTOM,
-            delegate=delegate,
-            parameters=parameters or {},
-            depends_on=depends_on or [],
-            timeout_seconds=timeout_seconds or self._config.default_timeout,
-            retry_count=retry_count or self._config.default_retry_count,
-        )
-        self._steps.append(step)
-        return self
+Covers step creation, backward compatibility with custom_step(),
+function aliasing and fluent chaining.
+"""
 
+import pytest
 
-# Test functions
-async def test_func(context, step, **params):
-    return {"success": True, "step_id": step.id}
+from workflows.builder import StepType
 
 
-def run_tests():
-    """Run validation tests for the step() method implementation."""
+async def step_func(context, step, **params):
+    return {"success": True, "step_id": step.id}
 
-    print("🔍 Testing WorkflowBuilder step() method implementation...")
-    print()
 
-    # Test 1: Basic functionality
-    print("✅ Test 1: Basic step() method functionality")
-    builder = WorkflowBuilder("test-workflow", "test_config.json")
+def test_step_basic_functionality(builder_factory):
+    """step() creates a custom step with all function fields callable."""
+    builder = builder_factory()
     builder.step(
         "test_step",
         "Test Step",
-        test_func,
+        step_func,
         description="Test step description",
         parameters={"mode": "test"},
     )
@@ -180,110 +34,187 @@ def run_tests():
     assert callable(step.delegate)
     assert callable(step.custom_function)
     assert callable(step.function)
-    print("   ✓ Step created correctly")
-    print("   ✓ All function fields are callable")
 
-    # Test 2: Backward compatibility
-    print("\n✅ Test 2: Backward compatibility with custom_step")
-    builder2 = WorkflowBuilder("test-workflow-2", "test_config.json")
 
-    # Test custom_step still works
-    builder2.custom_step("custom_test", "Custom Test", test_func)
-    # Test step method works
-    builder2.step("step_test", "Step Test", test_func)
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        pytest.param(
+            {"parameters": {"mode": "test"}, "timeout_seconds": 90},
+            {"parameters": {"mode": "test"}, "timeout_seconds": 90},
+            id="parameters",
+        ),
+        pytest.param(
+            {"depends_on": ["x"], "retry_count": 5},
+            {"depends_on": ["x"], "retry_count": 5},
+            id="dependencies",
+        ),
+        pytest.param(
+            {},
+            {
+                "description": "",
+                "parameters": {},
+                "depends_on": [],
+                "timeout_seconds": 120,
+                "retry_count": 2,
+            },
+            id="defaults",
+        ),
+    ],
+)
+def test_step_attributes(builder_factory, kwargs, expected):
+    """step() forwards keyword arguments and falls back to config defaults."""
+    builder = builder_factory()
+    builder.step("attr_step", "Attribute Step", step_func, **kwargs)
+
+    step = builder._steps[0]
+    for attr, value in expected.items():
+        assert getattr(step, attr) == value
+
+
+def test_step_backward_compatibility(builder_factory):
+    """custom_step() and step() can be mixed on the same builder."""
+    builder = builder_factory("test-workflow-2")
+    builder.custom_step("custom_test", "Custom Test", step_func)
+    builder.step("step_test", "Step Test", step_func)
 
-    assert len(builder2._steps) == 2
-    custom_step = builder2._steps[0]
-    step_step = builder2._steps[1]
+    assert len(builder._steps) == 2
+    custom_step, step_step = builder._steps
 
     assert custom_step.id == "custom_test"
     assert step_step.id == "step_test"
     assert custom_step.step_type == StepType.CUSTOM
     assert step_step.step_type == StepType.CUSTOM
-    print("   ✓ Both custom_step and step methods work")
-
-    # Test 3: Function aliasing
-    print("\n✅ Test 3: Function aliasing works correctly")
-
-    # For custom_step
-    assert custom_step.custom_function is test_func
-    assert custom_step.function is test_func
-    assert custom_step.delegate is None  # Should be None for custom_step
-    print("   ✓ custom_step aliasing works")
-
-    # For step method
-    assert step_step.delegate is test_func
-    assert step_step.custom_function is test_func  # Should be aliased
-    assert step_step.function is test_func  # Should be aliased
-    print("   ✓ step method aliasing works")
-
-    # Test 4: Equivalent functionality
-    print("\n✅ Test 4: Equivalent functionality between methods")
-
-    # Create identical steps with both methods
-    builder3 = WorkflowBuilder("test-workflow-3", "test_config.json")
-    builder3.custom_step(
-        "identical1",
-        "Identical Step",
-        test_func,
-        description="Test desc",
-        parameters={"value": 42},
-    )
-    builder3.step(
-        "identical2",
+
+
+def test_step_function_aliasing(builder_factory):
+    """The step callable is exposed through every function alias."""
+    builder = builder_factory("test-workflow-2")
+    builder.custom_step("custom_test", "Custom Test", step_func)
+    builder.step("step_test", "Step Test", step_func)
+    custom_step, step_step = builder._steps
+
+    assert custom_step.custom_function is step_func
+    assert custom_step.function is step_func
+    assert custom_step.delegate is step_func
+
+    assert step_step.delegate is step_func
+    assert step_step.custom_function is step_func
+    assert step_step.function is step_func
+
+
+def _step_attrs(step):
+    return {
+        "name": step.name,
+        "description": step.description,
+        "step_type": step.step_type,
+        "parameters": step.parameters,
+        "timeout_seconds": step.timeout_seconds,
+        "retry_count": step.retry_count,
+    }
+
+
+@pytest.fixture(scope="session")
+def golden_step_dict():
+    """Expected attributes of the equivalence step, built once per session."""
+    return {
+        "name": "Identical Step",
+        "description": "Test desc",
+        "step_type": StepType.CUSTOM,
+        "parameters": {"value": 42},
+        "timeout_seconds": 120,
+        "retry_count": 2,
+    }
+
+
+@pytest.mark.parametrize("method_name", ["custom_step", "step"])
+def test_step_equivalent_to_custom_step(builder_factory, golden_step_dict, method_name):
+    """custom_step() and step() produce equivalent steps."""
+    builder = builder_factory("test-workflow-3")
+    getattr(builder, method_name)(
+        "identical",
         "Identical Step",
-        test_func,
+        step_func,
         description="Test desc",
         parameters={"value": 42},
     )
 
-    step1 = builder3._steps[0]
-    step2 = builder3._steps[1]
-
-    # Compare all relevant attributes
-    assert step1.name == step2.name
-    assert step1.description == step2.description
-    assert step1.step_type == step2.step_type
-    assert step1.parameters == step2.parameters
-    assert step1.timeout_seconds == step2.timeout_seconds
-    assert step1.retry_count == step2.retry_count
-    print("   ✓ Both methods produce equivalent results")
-
-    # Test 5: Chaining works
-    print("\n✅ Test 5: Fluent interface chaining")
-
-    result_builder = (
-        WorkflowBuilder("chain-test", "test_config.json")
-        .custom_step("step1", "Step 1", test_func)
-        .step("step2", "Step 2", test_func)
-        .custom_step("step3", "Step 3", test_func)
-        .step("step4", "Step 4", test_func)
+    assert _step_attrs(builder._steps[0]) == golden_step_dict
+
+
+def test_step_fluent_chaining(builder_factory):
+    """step() and custom_step() chain fluently in any order."""
+    builder = (
+        builder_factory("chain-test")
+        .custom_step("step1", "Step 1", step_func)
+        .step("step2", "Step 2", step_func)
+        .custom_step("step3", "Step 3", step_func)
+        .step("step4", "Step 4", step_func)
     )
 
-    assert len(result_builder._steps) == 4
-    assert result_builder._steps[0].id == "step1"
-    assert result_builder._steps[1].id == "step2"
-    assert result_builder._steps[2].id == "step3"
-    assert result_builder._steps[3].id == "step4"
-    print("   ✓ Fluent chaining works with mixed methods")
+    assert [step.id for step in builder._steps] == [
+        "step1",
+        "step2",
+        "step3",
+        "step4",
+    ]
+
+
+def test_add_steps_bulk(builder_factory):
+    """add_steps() appends delegate steps equivalent to chained step() calls."""
+    builder = builder_factory("bulk-test").add_steps(
+        [
+            {"step_id": "step1", "name": "Step 1", "delegate": step_func},
+            {
+                "step_id": "step2",
+                "name": "Step 2",
+                "delegate": step_func,
+                "depends_on": ["step1"],
+                "retry_count": 5,
+            },
+        ]
+    )
 
-    print(
-        "\n🎉 All tests passed! The step() method implementation is working correctly."
+    step1, step2 = builder._steps
+    assert [step1.id, step2.id] == ["step1", "step2"]
+    assert step2.delegate is step_func
+    assert step2.depends_on == ["step1"]
+    assert step2.retry_count == 5
+
+
+def test_add_steps_accepts_step_kwargs(builder_factory):
+    """add_steps() takes the extra options step() accepts through **kwargs."""
+    builder = builder_factory().add_steps(
+        [
+            {
+                "step_id": "cached",
+                "name": "Cached",
+                "delegate": step_func,
+                "retry_count": 4,
+                "cache_ttl": 60,
+            }
+        ]
     )
-    print("📋 Summary:")
-    print("   • step() method works identically to custom_step()")
-    print("   • Backward compatibility is maintained")
-    print("   • Function aliasing works correctly")
-    print("   • Fluent interface chaining works")
-    print("   • No breaking changes detected")
+    builder.step("direct", "Direct", step_func, retry_count=4, cache_ttl=60)
 
-    return True
+    from_spec, direct = builder._steps
+    assert from_spec.retry_count == direct.retry_count == 4
+    assert from_spec.cache_ttl == direct.cache_ttl
 
 
-def test_func():
-    """Test function for pytest."""
-    run_tests()
+def test_add_steps_rejects_incomplete_spec(builder_factory):
+    """add_steps() validates every spec before adding any step."""
+    builder = builder_factory()
+
+    with pytest.raises(ValueError, match=r"positions \[1\]"):
+        builder.add_steps(
+            [
+                {"step_id": "ok", "name": "OK", "delegate": step_func},
+                {"step_id": "missing", "name": "No delegate"},
+            ]
+        )
+    assert builder._steps == []
 
 
 if __name__ == "__main__":
-    run_tests()
+    pytest.main([__file__, "-v"])
@@ -5,6 +5,7 @@ Tests JSON-first architecture, dual-sink logging, and CLI integration
 following Claude Code patterns.
 """
 
+import dataclasses
 import json
 import tempfile
 import pytest
@@ -23,6 +24,12 @@ from graphmcp_logging import (
 )
 
 
+def assert_all_in(text, patterns):
+    """Assert every pattern occurs in text, reporting all missing ones at once."""
+    missing = [pattern for pattern in patterns if pattern not in text]
+    assert not missing, f"missing from output: {missing}"
+
+
 class TestLoggingConfig:
     """Test logging configuration."""
 
@@ -75,6 +82,19 @@ class TestLoggingConfig:
         assert config.json_pretty_print == True
         assert config.progress_tracking_enabled == True
 
+    def test_preset_configs_are_shared(self):
+        """Test preset factories return one immutable instance."""
+        config = LoggingConfig.for_development()
+
+        assert LoggingConfig.for_development() is config
+        assert LoggingConfig.for_automation() is LoggingConfig.for_automation()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.console_level = "ERROR"
+
+        derived = dataclasses.replace(config, console_level="ERROR")
+        assert derived.console_level == "ERROR"
+        assert config.console_level == "DEBUG"
+
     def test_level_enabled_check(self):
         """Test log level threshold checking."""
         config = LoggingConfig(console_level="WARNING", file_level="DEBUG")
@@ -285,6 +305,31 @@ class TestStructuredLogger:
         assert "INFO" not in output  # No log level displayed
         assert "test_component" not in output  # No component displayed
 
+    def test_set_stream_redirects_console_output(self):
+        """Test console output goes to the stream injected via set_stream."""
+        config = LoggingConfig(output_format="console")
+        logger = StructuredLogger("test_workflow", config)
+        stream = StringIO()
+        logger.set_stream(stream)
+
+        logger.log_structured(
+            LogEntry.create(
+                workflow_id="test_workflow",
+                level="INFO",
+                component="test_component",
+                message="Redirected message",
+            )
+        )
+        logger.log_structured_data(
+            StructuredData.create_metrics(
+                workflow_id="test_workflow", title="Metrics", metrics={"files": 3}
+            )
+        )
+
+        output = stream.getvalue()
+        assert "Redirected message" in output
+        assert "[Metrics] metrics" in output
+
     def test_json_output_to_file(self):
         """Test JSON output to file."""
         with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp_file:
@@ -617,3 +662,66 @@ class TestIntegration:
 
         # Should complete without errors
         assert True
+
+    def test_full_workflow_logging_scenario(self):
+        """Test a complete workflow logging scenario."""
+        config = LoggingConfig.for_development()
+        logger = get_logger("integration_test", config)
+        stream = StringIO()
+        logger.structured_logger.set_stream(stream)
+
+        # Environment validation
+        logger.log_environment_validation_summary(57, 4, 3, 2.7)
+
+        # Workflow steps
+        logger.log_workflow_step_start("Analysis", 1, 3, "Analyzing repository")
+
+        # Progress tracking
+        step_id = logger.start_progress("File Processing", 10)
+        logger.update_progress(step_id, 5, 10)
+        logger.complete_progress(step_id)
+
+        # QA Results
+        qa_results = [
+            {
+                "check_name": "Test",
+                "status": "passed",
+                "confidence": 95,
+                "description": "OK",
+            }
+        ]
+        logger.log_quality_assurance_summary(qa_results)
+
+        # Operation completion
+        logger.log_operation_duration("GitHub PR Creation", 14.4, 13)
+
+        # Summary
+        logger.log_workflow_summary()
+
+        output = stream.getvalue()
+
+        # Verify all components are present and properly formatted
+        assert_all_in(
+            output,
+            [
+                "📊 Environment validated:",
+                "🔄 Starting step:",
+                "Progress: File Processing",
+                "📋 Quality Assurance:",
+                "✅ GitHub PR Creation completed:",
+                "Workflow completed",
+            ],
+        )
+
+        # Verify no verbose parameter dumps
+        assert "BRAVE_SEARCH_API_KEY" not in output
+        assert "length:" not in output
+
+
+def test_assert_all_in_reports_every_missing_pattern():
+    """Test assert_all_in names all absent fragments in one failure."""
+    assert_all_in("step started, step done", ["started", "done"])
+
+    with pytest.raises(AssertionError) as excinfo:
+        assert_all_in("step started", ["started", "done", "failed"])
+    assert "['done', 'failed']" in str(excinfo.value)
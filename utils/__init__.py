@@ -6,81 +6,86 @@ db_decommission_workflow implementation to ensure compatibility
 and reusability across different workflow contexts.
 """
 
-# Core configuration management
-from .config import MCPConfigManager
+import importlib
 
-# Session and connection management
-from .session import (
-    MCPSessionManager,
-    ensure_serializable,
-    execute_context7_search,
-    execute_github_analysis,
-)
+# Public names mapped to the submodule that defines them. Submodules are only
+# imported on first attribute access, so ``from utils import X`` pays for X's
+# module alone rather than the whole package.
+_LAZY_IMPORTS = {
+    # Core configuration management
+    "MCPConfigManager": "config",
+    # Session and connection management
+    "MCPSessionManager": "session",
+    "ensure_serializable": "session",
+    "execute_context7_search": "session",
+    "execute_github_analysis": "session",
+    # Retry handling
+    "MCPRetryHandler": "retry",
+    "TimedRetryHandler": "retry",
+    "retry_with_exponential_backoff": "retry",
+    # Exception classes
+    "MCPConfigError": "exceptions",
+    "MCPRetryError": "exceptions",
+    "MCPSessionError": "exceptions",
+    "MCPToolError": "exceptions",
+    "MCPUtilityError": "exceptions",
+    # Data models
+    "Context7Documentation": "data_models",
+    "FilesystemScanResult": "data_models",
+    "GitHubSearchResult": "data_models",
+    "MCPConfigStatus": "data_models",
+    "MCPServerConfig": "data_models",
+    "MCPSession": "data_models",
+    "MCPToolCall": "data_models",
+    # Extracted utilities from concrete implementations
+    "get_parameter_service": "parameter_service",
+    "ParameterService": "parameter_service",
+    "get_monitoring_system": "monitoring",
+    "MonitoringSystem": "monitoring",
+    "ProgressFrame": "progress_tracker",
+    "WorkflowProgress": "progress_tracker",
+    "ProgressTracker": "progress_tracker",
+    "create_progress_tracker": "progress_tracker",
+    "CacheStrategy": "performance_optimization",
+    "CacheEntry": "performance_optimization",
+    "PerformanceMetrics": "performance_optimization",
+    "AsyncCache": "performance_optimization",
+    "ConnectionPool": "performance_optimization",
+    "ParallelProcessor": "performance_optimization",
+    "PerformanceManager": "performance_optimization",
+    "get_performance_manager": "performance_optimization",
+    "cleanup_performance_manager": "performance_optimization",
+    "cached": "performance_optimization",
+    "timed": "performance_optimization",
+    "rate_limited": "performance_optimization",
+    "get_error_handler": "error_handling",
+    "ErrorHandler": "error_handling",
+    # Refactored utilities from concrete module
+    "SourceTypeClassifier": "source_type_classifier",
+    "SourceType": "source_type_classifier",
+    "ClassificationResult": "source_type_classifier",
+    "FileProcessor": "file_processor",
+    "ProcessingStrategy": "file_processor",
+    "ProcessingResult": "file_processor",
+    "FileDecommissionProcessor": "file_processor",
+    "EntityReferenceExtractor": "entity_reference_extractor",
+    "DatabaseReferenceExtractor": "entity_reference_extractor",
+}
 
-# Retry handling
-from .retry import MCPRetryHandler, TimedRetryHandler, retry_with_exponential_backoff
 
-# Exception classes
-from .exceptions import (
-    MCPConfigError,
-    MCPRetryError,
-    MCPSessionError,
-    MCPToolError,
-    MCPUtilityError,
-)
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
 
-# Data models
-from .data_models import (
-    Context7Documentation,
-    FilesystemScanResult,
-    GitHubSearchResult,
-    MCPConfigStatus,
-    MCPServerConfig,
-    MCPSession,
-    MCPToolCall,
-)
 
-# Extracted utilities from concrete implementations
-from .parameter_service import get_parameter_service, ParameterService
-from .monitoring import get_monitoring_system, MonitoringSystem
-from .progress_tracker import (
-    ProgressFrame,
-    WorkflowProgress,
-    ProgressTracker,
-    create_progress_tracker,
-)
-from .performance_optimization import (
-    CacheStrategy,
-    CacheEntry,
-    PerformanceMetrics,
-    AsyncCache,
-    ConnectionPool,
-    ParallelProcessor,
-    PerformanceManager,
-    get_performance_manager,
-    cleanup_performance_manager,
-    cached,
-    timed,
-    rate_limited,
-)
-from .error_handling import get_error_handler, ErrorHandler
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Refactored utilities from concrete module
-from .source_type_classifier import (
-    SourceTypeClassifier,
-    SourceType,
-    ClassificationResult,
-)
-from .file_processor import (
-    FileProcessor,
-    ProcessingStrategy,
-    ProcessingResult,
-    FileDecommissionProcessor,
-)
-from .entity_reference_extractor import (
-    EntityReferenceExtractor,
-    DatabaseReferenceExtractor,
-)
 
 __all__ = [
     # Configuration
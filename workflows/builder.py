@@ -7,21 +7,51 @@ that leverage multiple MCP servers.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
 import logging
 import pickle
+import sys
 import time
+import weakref
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import IntEnum, auto
+from types import ModuleType
 from typing import Any, Callable
 
+try:
+    # orjson encodes straight to bytes and is several times faster than json
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+# Instances of these types always pickle, so they are never test-encoded
+_PICKLE_SAFE_TYPES = frozenset(
+    {str, int, float, bool, complex, bytes, bytearray, type(None)}
+)
+_CONTAINER_TYPES = frozenset({dict, list, tuple, set, frozenset})
+
+
+def _keep_buffer_out_of_band(buffer: pickle.PickleBuffer) -> None:
+    """Leave protocol 5 buffers out of band so they are never copied."""
+    return None
+
+
 def ensure_serializable(data: Any) -> Any:
     """
     Ensure data is serializable by testing pickle serialization.
     Inline implementation to avoid circular imports.
 
+    Built-in containers and scalars are checked by walking the structure;
+    only other objects are actually pickled, so large results are not
+    encoded just to be thrown away.
+
     Args:
         data: Data to test for serializability
 
@@ -32,14 +62,38 @@ def ensure_serializable(data: Any) -> Any:
         RuntimeError: If data cannot be serialized
     """
     try:
-        pickle.dumps(data)
+        _check_picklable(data)
         return data
     except (TypeError, AttributeError) as e:
         logger.error(f"Data serialization failed: {e}")
         raise RuntimeError(f"Non-serializable data detected: {e}")
 
 
-class StepType(Enum):
+def _check_picklable(data: Any) -> None:
+    """Raise the error pickle.dumps would raise if data cannot be pickled."""
+    pending = [data]
+    seen: set[int] = set()
+    while pending:
+        item = pending.pop()
+        item_type = type(item)
+        if item_type in _PICKLE_SAFE_TYPES or id(item) in seen:
+            continue
+        seen.add(id(item))
+
+        if item_type is dict:
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif item_type in _CONTAINER_TYPES:
+            pending.extend(item)
+        else:
+            pickle.dumps(
+                item,
+                protocol=pickle.HIGHEST_PROTOCOL,
+                buffer_callback=_keep_buffer_out_of_band,
+            )
+
+
+class StepType(IntEnum):
     CUSTOM = auto()
     GITHUB = auto()
     CONTEXT7 = auto()
@@ -50,43 +104,46 @@ class StepType(Enum):
     GPT = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowStep:
     id: str
     name: str
     step_type: StepType
     description: str = ""
-    parameters: dict[str, Any] = field(default_factory=dict)
-    depends_on: list[str] = field(default_factory=list)
+    parameters: dict[str, Any] | None = None
+    depends_on: list[str] | None = None
     timeout_seconds: int = 120
     retry_count: int = 3
     server_name: str | None = None
     tool_name: str | None = None
-    custom_function: Callable | None = None
-
-    # Add serialization helper for functions
-    function: Callable | None = field(default=None, repr=False)
-
-    # NEW: Add delegate field for step() method
-    delegate: Callable | None = field(default=None, repr=False)
-
-    def __post_init__(self):
-        # PRESERVE: Existing compatibility logic
-        if self.custom_function and not self.function:
-            self.function = self.custom_function
-        elif self.function and not self.custom_function:
-            self.custom_function = self.function
-
-        # NEW: Handle delegate field compatibility
-        if self.delegate and not self.custom_function:
-            self.custom_function = self.delegate
-            self.function = self.delegate
-        elif self.delegate and self.custom_function:
-            # Both exist - preserve existing behavior
-            pass
-
-
-@dataclass
+    # Seconds an MCP tool result may be reused for identical calls; 0 disables
+    cache_ttl: int = 0
+
+    custom_function: Callable | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        # Interned keys let shared-context and client lookups match by identity
+        self.id = sys.intern(self.id)
+        if self.server_name is not None:
+            self.server_name = sys.intern(self.server_name)
+        # Materialize containers only when the caller did not supply them
+        if self.parameters is None:
+            self.parameters = {}
+        if self.depends_on is None:
+            self.depends_on = []
+
+    @property
+    def function(self) -> Callable | None:
+        """Read-only alias of custom_function."""
+        return self.custom_function
+
+    @property
+    def delegate(self) -> Callable | None:
+        """Read-only alias of custom_function, as passed to step()."""
+        return self.custom_function
+
+
+@dataclass(slots=True)
 class WorkflowResult:
     status: str
     duration_seconds: float
@@ -99,7 +156,7 @@ class WorkflowResult:
         return self.step_results.get(step_id, default)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowConfig:
     name: str
     config_path: str
@@ -110,15 +167,102 @@ class WorkflowConfig:
     default_retry_count: int = 2
 
 
+class _ToolCallBatcher:
+    """
+    Coalesce concurrent calls of one MCP tool on one client into a batch.
+
+    Calls made in the same event-loop iteration, such as steps that became
+    ready together, are queued and sent with a single call_tool_batch() when
+    the client provides one. Other clients are called one step at a time.
+    """
+
+    def __init__(self):
+        self._queued: dict[
+            tuple[int, str | None], list[tuple[WorkflowStep, asyncio.Future]]
+        ] = {}
+        # Flush tasks in flight; the loop only keeps weak references to tasks
+        self._flushing: set[asyncio.Task] = set()
+
+    async def call(self, client: Any, step: WorkflowStep) -> Any:
+        """Return the tool result for step, batched with its concurrent siblings."""
+        if not inspect.iscoroutinefunction(getattr(client, "call_tool_batch", None)):
+            return await client.call_tool_with_retry(
+                step.tool_name, step.parameters, retry_count=step.retry_count
+            )
+
+        loop = asyncio.get_running_loop()
+        key = (id(client), step.tool_name)
+        queued = self._queued.get(key)
+        if queued is None:
+            queued = self._queued[key] = []
+            # Flush once every step already scheduled has had a chance to queue
+            loop.call_soon(self._start_flush, loop, key, client)
+
+        future = loop.create_future()
+        queued.append((step, future))
+        return await future
+
+    def _start_flush(
+        self, loop: asyncio.AbstractEventLoop, key: tuple[int, str | None], client: Any
+    ) -> None:
+        task = loop.create_task(self._flush(key, client))
+        self._flushing.add(task)
+        task.add_done_callback(self._flushing.discard)
+
+    async def _flush(self, key: tuple[int, str | None], client: Any) -> None:
+        queued = self._queued.pop(key)
+        steps = [step for step, _ in queued]
+        try:
+            results = await client.call_tool_batch(
+                key[1],
+                [step.parameters for step in steps],
+                retry_count=max(step.retry_count for step in steps),
+            )
+        except Exception as e:
+            results = [e] * len(steps)
+        if len(results) != len(steps):
+            results = [
+                RuntimeError(
+                    f"call_tool_batch('{key[1]}') returned {len(results)} results "
+                    f"for {len(steps)} calls"
+                )
+            ] * len(steps)
+
+        for (_, future), result in zip(queued, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
 class WorkflowContext:
-    """Workflow execution context for sharing data between steps."""
+    """
+    Workflow execution context for sharing data between steps.
+
+    A context passed to Workflow.execute() keeps its MCP clients across
+    runs; close it with aclose(), or use it as an async context manager,
+    to hand them back to the session pool.
+    """
+
+    __slots__ = (
+        "config",
+        "_shared_context",
+        "_clients",
+        "_result_cache",
+        "_tool_batcher",
+    )
 
     def __init__(self, config: WorkflowConfig):
         self.config = config
-        self._shared_context = {}
-        self._clients = {}
+        self._shared_context: dict[str, Any] = {}
+        self._clients: dict[str, Any] = {}
+        # MCP tool results of steps with a cache_ttl, as (result, expires_at)
+        self._result_cache: dict[str, tuple[Any, float]] = {}
+        self._tool_batcher = _ToolCallBatcher()
 
-    def set_shared_value(self, key: str, value: Any):
+    def set_shared_value(self, key: str, value: Any) -> None:
         """Set a shared value accessible to all workflow steps."""
         self._shared_context[key] = ensure_serializable(value)
 
@@ -130,212 +274,393 @@ class WorkflowContext:
         """Get a step result from the shared context (alias for get_shared_value)."""
         return self.get_shared_value(step_id, default)
 
+    async def aclose(self) -> None:
+        """Hand the context's MCP clients back to the session pool."""
+        clients, self._clients = self._clients, {}
+        for client_name, client in clients.items():
+            try:
+                await _SESSION_POOL.release(client)
+                logger.debug(f"Released MCP client: {client_name}")
+            except Exception as e:
+                logger.warning(f"Error releasing MCP client {client_name}: {e}")
+
+    async def __aenter__(self) -> WorkflowContext:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+
+# MCP client class, looked up on the clients package, for each server name.
+# Slack is kept for completeness; db_decommission.py skips it.
+_CLIENT_CLASS_NAMES = {
+    "ovr_github": "GitHubMCPClient",
+    "ovr_repomix": "RepomixMCPClient",
+    "ovr_slack": "SlackMCPClient",
+}
+
+
+@functools.cache
+def _clients_package() -> ModuleType:
+    """Import the clients package on first use, avoiding a circular import."""
+    import clients
+
+    return clients
+
+
+if orjson is not None:
+    _CANONICAL_OPTIONS = (
+        orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+    )
+
+    def _canonical_bytes(value: Any) -> bytes:
+        """Encode value as JSON with sorted keys."""
+        return orjson.dumps(value, default=str, option=_CANONICAL_OPTIONS)
+
+else:
+
+    def _canonical_bytes(value: Any) -> bytes:
+        """Encode value as JSON with sorted keys."""
+        return json.dumps(value, sort_keys=True, default=str).encode()
+
+
+def _tool_cache_key(step: WorkflowStep) -> str:
+    """Hash the server, tool and canonicalized parameters of an MCP call."""
+    payload = _canonical_bytes(
+        {"s": step.server_name, "t": step.tool_name, "p": step.parameters}
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class MCPSessionPool:
+    """
+    Process-wide pool of idle MCP clients, reused across workflow runs.
+
+    Clients are kept per event loop, since a client's server connection is
+    bound to the loop that opened it, then by client class and config path.
+    Idle clients unused for longer than session_ttl seconds are closed on the
+    next acquire or release, and the rest when their loop shuts down its
+    async generators, as asyncio.run() does on return. Code that drives its
+    own loop (run_until_complete() then close()) must await close_idle() on
+    that loop before closing it; otherwise its idle clients are never closed
+    and the loop's shutdown hook keeps the loop alive. After either, the pool
+    holds no reference to the loop, as all per-loop state is weakly keyed.
+    """
+
+    def __init__(self, session_ttl: float = 300.0):
+        self.session_ttl = session_ttl
+        self._idle: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[tuple, list[tuple[Any, float]]]
+        ] = weakref.WeakKeyDictionary()
+        self._leased: dict[int, tuple[weakref.ref, tuple]] = {}
+        # Per loop, a suspended async generator the loop finalizes on shutdown;
+        # it references the loop through its finalizer until it finishes
+        self._shutdown_hooks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Any
+        ] = weakref.WeakKeyDictionary()
+
+    async def acquire(self, client_class: type, config_path: str) -> Any:
+        """Return an idle client for the server, or construct a new one."""
+        loop = asyncio.get_running_loop()
+        key = (client_class, str(config_path))
+        if loop not in self._shutdown_hooks:
+            hook = self._close_idle_on_shutdown()
+            # Starting it inside the loop registers it for shutdown_asyncgens()
+            await hook.asend(None)
+            self._shutdown_hooks[loop] = hook
+        await self._evict_expired()
+
+        idle = self._idle.get(loop, {}).get(key)
+        client = idle.pop()[0] if idle else client_class(config_path)
+        self._leased[id(client)] = (weakref.ref(loop), key)
+        return client
+
+    async def release(self, client: Any) -> None:
+        """Return an acquired client to the pool for later reuse."""
+        loop_ref, key = self._leased.pop(id(client), (None, None))
+        loop = loop_ref() if loop_ref is not None else None
+        if loop is None or loop.is_closed():
+            await client.close()
+            return
+        self._idle.setdefault(loop, {}).setdefault(key, []).append(
+            (client, time.monotonic())
+        )
+        await self._evict_expired()
+
+    async def close_idle(self) -> None:
+        """
+        Close every idle client owned by the running event loop.
+
+        Call this before closing a loop that was not run by asyncio.run().
+        """
+        hook = self._shutdown_hooks.pop(asyncio.get_running_loop(), None)
+        if hook is None:
+            await self._evict_expired(max_idle=0.0)
+        else:
+            # Finishing the hook closes the clients and lets go of the loop
+            await hook.aclose()
+
+    async def _close_idle_on_shutdown(self):
+        try:
+            yield
+        finally:
+            self._shutdown_hooks.pop(asyncio.get_running_loop(), None)
+            await self._evict_expired(max_idle=0.0)
+
+    async def _evict_expired(self, max_idle: float | None = None) -> None:
+        max_idle = self.session_ttl if max_idle is None else max_idle
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+
+        for other in [other for other in self._idle if other.is_closed()]:
+            # Connections of a finished loop cannot be closed any more
+            del self._idle[other]
+
+        by_server = self._idle.get(loop, {})
+        for key in list(by_server):
+            kept, expired = [], []
+            for client, released_at in by_server[key]:
+                if now - released_at >= max_idle:
+                    expired.append(client)
+                else:
+                    kept.append((client, released_at))
+            by_server[key] = kept
+            for client in expired:
+                try:
+                    await client.close()
+                except Exception as e:
+                    logger.warning(f"Error closing pooled MCP client {client}: {e}")
+
+
+_SESSION_POOL = MCPSessionPool()
+
+
+class _StepKind(IntEnum):
+    """How a step is executed; indexes _STEP_HANDLERS."""
+
+    CUSTOM = 0
+    TOOL = 1
+    UNHANDLED = 2
+
+
+def _step_kind(step: WorkflowStep) -> _StepKind:
+    """Classify a step by what it carries, whatever its StepType."""
+    if step.custom_function:
+        return _StepKind.CUSTOM
+    if step.server_name and step.tool_name:
+        return _StepKind.TOOL
+    return _StepKind.UNHANDLED
+
+
+@dataclass(slots=True, frozen=True)
+class _StepLogHooks:
+    """Step hooks of an enhanced logger, resolved once per workflow run."""
+
+    start: Callable | None = None
+    progress: Callable | None = None
+    end: Callable | None = None
+    # Progress reports still in flight, per step id
+    _pending: dict[str, set[asyncio.Task]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    @classmethod
+    def from_logger(cls, enhanced_logger) -> _StepLogHooks:
+        return cls(
+            start=getattr(enhanced_logger, "log_step_start_async", None),
+            progress=getattr(enhanced_logger, "log_step_progress_async", None),
+            end=getattr(enhanced_logger, "log_step_end_async", None),
+        )
+
+    def report_progress(self, step_id: str, progress: float, message: str) -> None:
+        """Send a progress report in the background, off the step's critical path."""
+        if not self.progress:
+            return
+        task = asyncio.create_task(
+            _ignore_errors(self.progress, step_id, progress, message)
+        )
+        self._pending.setdefault(step_id, set()).add(task)
+
+    async def report_start(self, step: WorkflowStep) -> None:
+        """Report that a step is starting."""
+        if self.start:
+            await _ignore_errors(
+                self.start, step.id, step.description or step.name, step.parameters
+            )
+
+    async def report_end(
+        self, step_id: str, details: dict[str, Any], succeeded: bool
+    ) -> None:
+        """Report a step's outcome once its progress reports are delivered."""
+        pending = self._pending.pop(step_id, None)
+        if pending:
+            await asyncio.gather(*pending)
+        if self.end:
+            await _ignore_errors(self.end, step_id, details, succeeded)
+
+
+async def _ignore_errors(hook: Callable, *args: Any) -> None:
+    """Await a logging hook whose failure must not affect the workflow."""
+    try:
+        await hook(*args)
+    except Exception as e:
+        logger.debug(f"Enhanced logging hook {hook!r} failed: {e}")
+
+
+def _dependency_graph(steps: list[WorkflowStep]) -> tuple[list[int], list[list[int]]]:
+    """
+    Index the step dependencies for trigger-driven execution.
+
+    Returns, per step position, the number of upstream steps it waits for
+    and the positions of the steps waiting on it. Dependencies on ids that
+    are not part of the workflow are ignored.
+
+    Raises:
+        ValueError: If the step dependencies contain a cycle
+    """
+    positions: dict[str, list[int]] = {}
+    for index, step in enumerate(steps):
+        positions.setdefault(step.id, []).append(index)
+
+    indegree = [0] * len(steps)
+    downstream: list[list[int]] = [[] for _ in steps]
+    for index, step in enumerate(steps):
+        for dep in dict.fromkeys(step.depends_on):
+            for upstream in positions.get(dep, ()):
+                downstream[upstream].append(index)
+                indegree[index] += 1
+
+    remaining = indegree.copy()
+    ready = [index for index, count in enumerate(remaining) if count == 0]
+    for index in ready:
+        for child in downstream[index]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                ready.append(child)
+
+    if len(ready) != len(steps):
+        blocked = [step.id for step, count in zip(steps, remaining) if count]
+        raise ValueError(f"Circular step dependencies between: {blocked}")
+    return indegree, downstream
+
+
+# Placeholder result of a step that stop_on_error kept from running
+_NOT_RUN = object()
+
 
 class Workflow:
     """Represents a compiled, executable workflow."""
 
-    def __init__(self, config: WorkflowConfig, steps: list[WorkflowStep]):
+    def __init__(
+        self,
+        config: WorkflowConfig,
+        steps: list[WorkflowStep],
+        graph: tuple[list[int], list[list[int]]] | None = None,
+        context: WorkflowContext | None = None,
+    ):
         self.config = config
         self.steps = steps
+        self.context = context
+        self._indegree, self._downstream = (
+            _dependency_graph(steps) if graph is None else graph
+        )
 
-    async def execute(self, enhanced_logger=None) -> WorkflowResult:
-        """Execute the workflow with proper context management and optional enhanced logging."""
+    async def execute(
+        self, enhanced_logger: Any = None, context: WorkflowContext | None = None
+    ) -> WorkflowResult:
+        """
+        Execute the workflow with proper context management and optional enhanced logging.
+
+        Up to config.max_parallel_steps workers take steps from a ready
+        queue. Each finished step decrements the dependency counters of the
+        steps waiting on it and queues those whose counter reaches zero, so
+        a slow step only holds back its own dependents.
+
+        A context passed here or to the constructor is reused as is, keeping
+        its shared values and MCP clients after the run until the caller
+        calls its aclose(); otherwise a fresh context is created and closed
+        at the end of the run.
+        """
         logger.info(f"Executing workflow: {self.config.name}")
-        start_time = time.time()
-        results = {}
+        start_time = time.perf_counter()
+        steps_count = len(self.steps)
+        # Every step id up front, so filling in results never grows the dict
+        results: dict[str, Any] = dict.fromkeys(
+            [step.id for step in self.steps], _NOT_RUN
+        )
         completed_count = 0
         failed_count = 0
 
-        # Create workflow context
-        context = WorkflowContext(self.config)
+        # Create workflow context unless the caller keeps one across runs
+        if context is None:
+            context = self.context
+        owned_context = context is None
+        if context is None:
+            context = WorkflowContext(self.config)
 
         # Initialize enhanced logging if provided
         if enhanced_logger and hasattr(enhanced_logger, "initialize_progress_tracking"):
             try:
-                await enhanced_logger.initialize_progress_tracking(len(self.steps))
+                await enhanced_logger.initialize_progress_tracking(steps_count)
                 enhanced_logger.log_workflow_start(
-                    [self.config.name], {"steps": len(self.steps)}
+                    [self.config.name], {"steps": steps_count}
                 )
             except Exception as e:
                 logger.warning(f"Failed to initialize enhanced logging: {e}")
                 enhanced_logger = None
 
-        # Simplified sequential execution for demonstration
-        for step_index, step in enumerate(self.steps):
-            logger.info(f"Executing step: {step.id} ({step.name})")
-
-            # Enhanced logging: Start step tracking
-            if enhanced_logger and hasattr(enhanced_logger, "log_step_start_async"):
-                try:
-                    await enhanced_logger.log_step_start_async(
-                        step.id, step.description or step.name, step.parameters
-                    )
-                except Exception as e:
-                    logger.warning(f"Enhanced logging step start failed: {e}")
-
-            try:
-                if step.custom_function:
-                    # Enhanced logging: Initial progress
-                    if enhanced_logger and hasattr(
-                        enhanced_logger, "log_step_progress_async"
-                    ):
-                        try:
-                            await enhanced_logger.log_step_progress_async(
-                                step.id, 0.1, "Starting custom function execution"
-                            )
-                        except Exception:
-                            pass
-
-                    # Pass parameters correctly to the function
-                    step_result = await step.custom_function(
-                        context, step, **step.parameters
-                    )
-                    results[step.id] = ensure_serializable(step_result)
-                    context.set_shared_value(
-                        step.id, step_result
-                    )  # Make result available in shared context
-                    completed_count += 1
-
-                    # Enhanced logging: Step completion
-                    if enhanced_logger and hasattr(
-                        enhanced_logger, "log_step_end_async"
-                    ):
-                        try:
-                            await enhanced_logger.log_step_end_async(
-                                step.id, {"result": "Custom function completed"}, True
-                            )
-                        except Exception:
-                            pass
-                else:
-                    # Execute MCP tool steps
-                    if step.server_name and step.tool_name:
-                        try:
-                            # Enhanced logging: Client initialization progress
-                            if enhanced_logger and hasattr(
-                                enhanced_logger, "log_step_progress_async"
-                            ):
-                                try:
-                                    await enhanced_logger.log_step_progress_async(
-                                        step.id, 0.2, "Initializing MCP client"
-                                    )
-                                except Exception:
-                                    pass
-
-                            # Dynamically import the client based on server_name
-                            if step.server_name == "ovr_github":
-                                from clients import GitHubMCPClient as ClientClass
-                            elif step.server_name == "ovr_repomix":
-                                from clients import RepomixMCPClient as ClientClass
-                            elif step.server_name == "ovr_slack":
-                                # Temporarily re-add Slack for completeness, will skip it in db_decommission.py
-                                from clients import SlackMCPClient as ClientClass
-                            else:
-                                raise ValueError(
-                                    f"Unsupported server name: {step.server_name}"
-                                )
-
-                            client = context._clients.get(
-                                step.server_name
-                            ) or ClientClass(context.config.config_path)
-                            context._clients[step.server_name] = client
-
-                            # Enhanced logging: Tool execution progress
-                            if enhanced_logger and hasattr(
-                                enhanced_logger, "log_step_progress_async"
-                            ):
-                                try:
-                                    await enhanced_logger.log_step_progress_async(
-                                        step.id, 0.5, f"Executing {step.tool_name}"
-                                    )
-                                except Exception:
-                                    pass
-
-                            logger.info(
-                                f"Calling MCP tool '{step.tool_name}' on server "
-                                f"'{step.server_name}' for step '{step.id}'"
-                            )
-                            tool_result = await client.call_tool_with_retry(
-                                step.tool_name,
-                                step.parameters,
-                                retry_count=step.retry_count,
-                            )
-                            results[step.id] = ensure_serializable(tool_result)
-                            context.set_shared_value(step.id, tool_result)
-                            completed_count += 1
-
-                            # Enhanced logging: Tool completion
-                            if enhanced_logger and hasattr(
-                                enhanced_logger, "log_step_end_async"
-                            ):
-                                try:
-                                    await enhanced_logger.log_step_end_async(
-                                        step.id,
-                                        {"tool_result": "MCP tool completed"},
-                                        True,
-                                    )
-                                except Exception:
-                                    pass
-                        except Exception as client_e:
-                            logger.error(
-                                f"MCP client call failed for step {step.id} ({step.name}): {client_e}"
-                            )
-                            results[step.id] = {"error": str(client_e)}
-                            failed_count += 1
-
-                            # Enhanced logging: Step failure
-                            if enhanced_logger and hasattr(
-                                enhanced_logger, "log_step_end_async"
-                            ):
-                                try:
-                                    await enhanced_logger.log_step_end_async(
-                                        step.id, {"error": str(client_e)}, False
-                                    )
-                                except Exception:
-                                    pass
-
-                            if self.config.stop_on_error:
-                                break
-                    else:
-                        # Fallback for unhandled step types (should not happen if all are covered)
-                        logger.warning(
-                            f"Unhandled step type: {step.step_type.name} for step "
-                            f"{step.id}. Mocking execution."
-                        )
-                        results[step.id] = {
-                            "status": "mocked_unhandled",
-                            "step_type": step.step_type.name,
-                        }
-                        completed_count += 1
-
-                        # Enhanced logging: Mocked step completion
-                        if enhanced_logger and hasattr(
-                            enhanced_logger, "log_step_end_async"
-                        ):
-                            try:
-                                await enhanced_logger.log_step_end_async(
-                                    step.id, {"status": "mocked_unhandled"}, True
-                                )
-                            except Exception:
-                                pass
-            except Exception as e:
-                logger.error(f"Step {step.id} failed: {e}")
-                results[step.id] = {"error": str(e)}
+        hooks = _StepLogHooks.from_logger(enhanced_logger)
+        outcomes: list[tuple[Any, bool] | None] = [None] * steps_count
+        remaining = self._indegree.copy()
+        ready: asyncio.Queue[int | None] = asyncio.Queue()
+        for index, count in enumerate(remaining):
+            if count == 0:
+                ready.put_nowait(index)
+        # Steps queued or running; the last one to finish stops the workers
+        outstanding = ready.qsize()
+        workers = min(max(1, self.config.max_parallel_steps), outstanding)
+        stopped = False
+
+        async def worker() -> None:
+            nonlocal outstanding, stopped
+            while (index := await ready.get()) is not None:
+                if not stopped:
+                    outcome = await self._run_step(self.steps[index], context, hooks)
+                    outcomes[index] = outcome
+                    if not outcome[1] and self.config.stop_on_error:
+                        stopped = True
+                    if not stopped:
+                        for child in self._downstream[index]:
+                            remaining[child] -= 1
+                            if remaining[child] == 0:
+                                outstanding += 1
+                                ready.put_nowait(child)
+
+                outstanding -= 1
+                if outstanding == 0:
+                    for _ in range(workers):
+                        ready.put_nowait(None)
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        for step, outcome in zip(self.steps, outcomes):
+            if outcome is None:
+                continue
+            step_result, succeeded = outcome
+            results[step.id] = step_result
+            if succeeded:
+                completed_count += 1
+            else:
                 failed_count += 1
+        if stopped:
+            results = {
+                step_id: result
+                for step_id, result in results.items()
+                if result is not _NOT_RUN
+            }
 
-                # Enhanced logging: General step failure
-                if enhanced_logger and hasattr(enhanced_logger, "log_step_end_async"):
-                    try:
-                        await enhanced_logger.log_step_end_async(
-                            step.id, {"error": str(e)}, False
-                        )
-                    except Exception:
-                        pass
-
-                if self.config.stop_on_error:
-                    break
-
-        duration = time.time() - start_time
-        success_rate = (completed_count / len(self.steps)) * 100 if self.steps else 100
+        duration = time.perf_counter() - start_time
+        success_rate = completed_count * 100.0 / steps_count if steps_count else 100
 
         status = (
             "completed"
@@ -350,13 +675,9 @@ class Workflow:
             except Exception as e:
                 logger.warning(f"Enhanced logging workflow end failed: {e}")
 
-        # Cleanup: Close all cached MCP clients to prevent memory leaks
-        for client_name, client in context._clients.items():
-            try:
-                await client.close()
-                logger.debug(f"Closed MCP client: {client_name}")
-            except Exception as e:
-                logger.warning(f"Error closing MCP client {client_name}: {e}")
+        # Cleanup: Hand the MCP clients back to the pool for the next run
+        if owned_context:
+            await context.aclose()
 
         return WorkflowResult(
             status=status,
@@ -367,6 +688,129 @@ class Workflow:
             steps_failed=failed_count,
         )
 
+    async def _run_step(
+        self, step: WorkflowStep, context: WorkflowContext, hooks: _StepLogHooks
+    ) -> tuple[Any, bool]:
+        """Run a single step and return its result and whether it succeeded."""
+        logger.info(f"Executing step: {step.id} ({step.name})")
+
+        # Enhanced logging: Start step tracking
+        await hooks.report_start(step)
+
+        kind = _step_kind(step)
+        try:
+            step_result, end_details = await _STEP_HANDLERS[kind](
+                self, step, context, hooks
+            )
+        except Exception as e:
+            if kind is _StepKind.TOOL:
+                logger.error(
+                    f"MCP client call failed for step {step.id} ({step.name}): {e}"
+                )
+            else:
+                logger.error(f"Step {step.id} failed: {e}")
+
+            # Enhanced logging: Step failure
+            await hooks.report_end(step.id, {"error": str(e)}, False)
+            return {"error": str(e)}, False
+
+        # Enhanced logging: Step completion
+        await hooks.report_end(step.id, end_details, True)
+        return step_result, True
+
+    async def _run_custom_step(
+        self, step: WorkflowStep, context: WorkflowContext, hooks: _StepLogHooks
+    ) -> tuple[Any, dict[str, Any]]:
+        """Run the step's own function and share its result."""
+        # Enhanced logging: Initial progress
+        hooks.report_progress(step.id, 0.1, "Starting custom function execution")
+
+        # Pass parameters correctly to the function
+        step_result = await step.custom_function(context, step, **step.parameters)
+        # Share the checked result without set_shared_value() checking it again
+        step_result = ensure_serializable(step_result)
+        context._shared_context[step.id] = step_result
+        return step_result, {"result": "Custom function completed"}
+
+    async def _run_tool_step(
+        self, step: WorkflowStep, context: WorkflowContext, hooks: _StepLogHooks
+    ) -> tuple[Any, dict[str, Any]]:
+        """Run the step's MCP tool, reusing a cached result when allowed."""
+        cache_key = _tool_cache_key(step) if step.cache_ttl > 0 else None
+        cached = context._result_cache.get(cache_key) if cache_key else None
+        if cached and cached[1] > time.monotonic():
+            logger.info(
+                f"Reusing cached '{step.tool_name}' result for step '{step.id}'"
+            )
+            tool_result = cached[0]
+        else:
+            tool_result = ensure_serializable(
+                await self._call_tool(step, context, hooks)
+            )
+            if cache_key:
+                # Only successful results reach the cache
+                context._result_cache[cache_key] = (
+                    tool_result,
+                    time.monotonic() + step.cache_ttl,
+                )
+        # Already checked above or before it was cached
+        context._shared_context[step.id] = tool_result
+        return tool_result, {"tool_result": "MCP tool completed"}
+
+    async def _run_unhandled_step(
+        self, step: WorkflowStep, context: WorkflowContext, hooks: _StepLogHooks
+    ) -> tuple[Any, dict[str, Any]]:
+        """Mock steps that have neither a function nor an MCP tool."""
+        # Fallback for unhandled step types (should not happen if all are covered)
+        logger.warning(
+            f"Unhandled step type: {step.step_type.name} for step "
+            f"{step.id}. Mocking execution."
+        )
+        return {
+            "status": "mocked_unhandled",
+            "step_type": step.step_type.name,
+        }, {"status": "mocked_unhandled"}
+
+    async def _call_tool(
+        self, step: WorkflowStep, context: WorkflowContext, hooks: _StepLogHooks
+    ) -> Any:
+        """Call the step's MCP tool through the context's client for its server."""
+        # Enhanced logging: Client initialization progress
+        hooks.report_progress(step.id, 0.2, "Initializing MCP client")
+
+        class_name = _CLIENT_CLASS_NAMES.get(step.server_name)
+        if class_name is None:
+            raise ValueError(f"Unsupported server name: {step.server_name}")
+        ClientClass = getattr(_clients_package(), class_name)
+
+        client = context._clients.get(step.server_name)
+        if client is None:
+            client = await _SESSION_POOL.acquire(
+                ClientClass, context.config.config_path
+            )
+            # A concurrent step may have registered a client meanwhile
+            shared = context._clients.setdefault(step.server_name, client)
+            if shared is not client:
+                await _SESSION_POOL.release(client)
+                client = shared
+
+        # Enhanced logging: Tool execution progress
+        hooks.report_progress(step.id, 0.5, f"Executing {step.tool_name}")
+
+        logger.info(
+            f"Calling MCP tool '{step.tool_name}' on server "
+            f"'{step.server_name}' for step '{step.id}'"
+        )
+        return await context._tool_batcher.call(client, step)
+
+
+# Step runners in _StepKind order
+_STEP_HANDLERS = (
+    Workflow._run_custom_step,
+    Workflow._run_tool_step,
+    Workflow._run_unhandled_step,
+)
+
 
 class WorkflowBuilder:
     """A fluent builder for constructing GraphMCP workflows."""
@@ -397,26 +841,23 @@ class WorkflowBuilder:
         name: str,
         func: Callable,
         description: str = "",
-        parameters: dict = None,
-        depends_on: list[str] = None,
-        timeout_seconds: int = None,
-        retry_count: int = None,
+        parameters: dict | None = None,
+        depends_on: list[str] | None = None,
+        timeout_seconds: int | None = None,
+        retry_count: int | None = None,
         **kwargs,
     ) -> WorkflowBuilder:
         """Add a custom step with a user-defined function."""
-        step = WorkflowStep(
-            id=step_id,
-            name=name,
+        return self._add_step(
+            step_id,
+            name,
+            func,
             description=description,
-            step_type=StepType.CUSTOM,
-            custom_function=func,
-            parameters=parameters or {},
-            depends_on=depends_on or [],
-            timeout_seconds=timeout_seconds or self._config.default_timeout,
-            retry_count=retry_count or self._config.default_retry_count,
+            parameters=parameters,
+            depends_on=depends_on,
+            timeout_seconds=timeout_seconds,
+            retry_count=retry_count,
         )
-        self._steps.append(step)
-        return self
 
     def step(
         self,
@@ -424,10 +865,10 @@ class WorkflowBuilder:
         name: str,
         delegate: Callable,
         description: str = "",
-        parameters: dict = None,
-        depends_on: list[str] = None,
-        timeout_seconds: int = None,
-        retry_count: int = None,
+        parameters: dict | None = None,
+        depends_on: list[str] | None = None,
+        timeout_seconds: int | None = None,
+        retry_count: int | None = None,
         **kwargs,
     ) -> WorkflowBuilder:
         """
@@ -451,18 +892,106 @@ class WorkflowBuilder:
         Returns:
             WorkflowBuilder: Self for method chaining
         """
-        step = WorkflowStep(
+        return self._add_step(
+            step_id,
+            name,
+            delegate,
+            description=description,
+            parameters=parameters,
+            depends_on=depends_on,
+            timeout_seconds=timeout_seconds,
+            retry_count=retry_count,
+        )
+
+    def _add_step(
+        self,
+        step_id: str,
+        name: str,
+        func: Callable,
+        *,
+        description: str,
+        parameters: dict | None,
+        depends_on: list[str] | None,
+        timeout_seconds: int | None,
+        retry_count: int | None,
+    ) -> WorkflowBuilder:
+        """Append a custom step shared by custom_step() and step()."""
+        self._steps.append(
+            self._new_custom_step(
+                step_id,
+                name,
+                func,
+                description=description,
+                parameters=parameters,
+                depends_on=depends_on,
+                timeout_seconds=timeout_seconds,
+                retry_count=retry_count,
+            )
+        )
+        return self
+
+    def _new_custom_step(
+        self,
+        step_id: str,
+        name: str,
+        func: Callable,
+        *,
+        description: str = "",
+        parameters: dict | None = None,
+        depends_on: list[str] | None = None,
+        timeout_seconds: int | None = None,
+        retry_count: int | None = None,
+    ) -> WorkflowStep:
+        """Create a custom step with the builder's default timeout and retries."""
+        return WorkflowStep(
             id=step_id,
             name=name,
             description=description,
             step_type=StepType.CUSTOM,
-            delegate=delegate,
-            parameters=parameters or {},
-            depends_on=depends_on or [],
+            parameters=parameters,
+            depends_on=depends_on,
             timeout_seconds=timeout_seconds or self._config.default_timeout,
             retry_count=retry_count or self._config.default_retry_count,
+            custom_function=func,
         )
-        self._steps.append(step)
+
+    def add_steps(self, specs: list[dict[str, Any]]) -> WorkflowBuilder:
+        """
+        Add several delegate steps in one call.
+
+        Each spec holds the keyword arguments of step(), with step_id, name
+        and delegate required. Other keys are accepted just as step() accepts
+        them through **kwargs. Every spec is validated and turned into a step
+        before any is added, so a bad spec leaves the builder unchanged.
+
+        Args:
+            specs: Step specifications in execution order
+
+        Returns:
+            WorkflowBuilder: Self for method chaining
+        """
+        required = {"step_id", "name", "delegate"}
+        invalid = [i for i, spec in enumerate(specs) if not required <= spec.keys()]
+        if invalid:
+            raise ValueError(
+                f"Step specs at positions {invalid} must define step_id, name "
+                "and delegate"
+            )
+
+        steps = [
+            self._new_custom_step(
+                spec["step_id"],
+                spec["name"],
+                spec["delegate"],
+                description=spec.get("description", ""),
+                parameters=spec.get("parameters"),
+                depends_on=spec.get("depends_on"),
+                timeout_seconds=spec.get("timeout_seconds"),
+                retry_count=spec.get("retry_count"),
+            )
+            for spec in specs
+        ]
+        self._steps.extend(steps)
         return self
 
     def step_auto(
@@ -496,9 +1025,9 @@ class WorkflowBuilder:
         self,
         step_id: str,
         repo_url: str,
-        include_patterns: list[str] = None,
-        exclude_patterns: list[str] = None,
-        parameters: dict = None,
+        include_patterns: list[str] | None = None,
+        exclude_patterns: list[str] | None = None,
+        parameters: dict | None = None,
         **kwargs,
     ) -> WorkflowBuilder:
         """Add a Repomix repository packing step."""
@@ -519,15 +1048,16 @@ class WorkflowBuilder:
             server_name="ovr_repomix",  # Set server_name
             tool_name="pack_remote_repository",  # Set tool_name
             parameters=step_params,
-            depends_on=kwargs.get("depends_on", []),
+            depends_on=kwargs.get("depends_on"),
             timeout_seconds=kwargs.get("timeout_seconds", self._config.default_timeout),
             retry_count=kwargs.get("retry_count", self._config.default_retry_count),
+            cache_ttl=kwargs.get("cache_ttl", 0),
         )
         self._steps.append(step)
         return self
 
     def github_analyze_repo(
-        self, step_id: str, repo_url: str, parameters: dict = None, **kwargs
+        self, step_id: str, repo_url: str, parameters: dict | None = None, **kwargs
     ) -> WorkflowBuilder:
         """Add a GitHub repository analysis step."""
         # Remove the async def step_func
@@ -543,9 +1073,10 @@ class WorkflowBuilder:
             server_name="ovr_github",  # Set server_name
             tool_name="analyze_repo_structure",  # Set tool_name
             parameters=step_params,
-            depends_on=kwargs.get("depends_on", []),
+            depends_on=kwargs.get("depends_on"),
             timeout_seconds=kwargs.get("timeout_seconds", self._config.default_timeout),
             retry_count=kwargs.get("retry_count", self._config.default_retry_count),
+            cache_ttl=kwargs.get("cache_ttl", 0),
         )
         self._steps.append(step)
         return self
@@ -557,7 +1088,7 @@ class WorkflowBuilder:
         head: str,
         base: str,
         body_template: str,
-        parameters: dict = None,
+        parameters: dict | None = None,
         **kwargs,
     ) -> WorkflowBuilder:
         """Add a GitHub pull request creation step."""
@@ -579,9 +1110,10 @@ class WorkflowBuilder:
             server_name="ovr_github",  # Set server_name
             tool_name="create_pull_request",  # Set tool_name
             parameters=step_params,
-            depends_on=kwargs.get("depends_on", []),
+            depends_on=kwargs.get("depends_on"),
             timeout_seconds=kwargs.get("timeout_seconds", self._config.default_timeout),
             retry_count=kwargs.get("retry_count", self._config.default_retry_count),
+            cache_ttl=kwargs.get("cache_ttl", 0),
         )
         self._steps.append(step)
         return self
@@ -591,7 +1123,7 @@ class WorkflowBuilder:
         step_id: str,
         channel_id: str,
         text_or_fn: str | Callable,
-        parameters: dict = None,
+        parameters: dict | None = None,
         **kwargs,
     ) -> WorkflowBuilder:
         """Add a Slack message posting step. Supports both text strings and dynamic text functions."""
@@ -606,15 +1138,21 @@ class WorkflowBuilder:
             server_name="ovr_slack",
             tool_name="slack_post_message",  # Corrected tool name
             parameters=step_params,
-            depends_on=kwargs.get("depends_on", []),
+            depends_on=kwargs.get("depends_on"),
             timeout_seconds=kwargs.get("timeout_seconds", self._config.default_timeout),
             retry_count=kwargs.get("retry_count", self._config.default_retry_count),
+            cache_ttl=kwargs.get("cache_ttl", 0),
         )
         self._steps.append(step)
         return self
 
     def gpt_step(
-        self, step_id: str, model: str, prompt: str, parameters: dict = None, **kwargs
+        self,
+        step_id: str,
+        model: str,
+        prompt: str,
+        parameters: dict | None = None,
+        **kwargs,
     ) -> WorkflowBuilder:
         """Add a GPT analysis step."""
 
@@ -639,16 +1177,18 @@ class WorkflowBuilder:
             step_type=StepType.GPT,
             custom_function=step_func,
             parameters=step_params,
-            depends_on=kwargs.get("depends_on", []),
+            depends_on=kwargs.get("depends_on"),
             timeout_seconds=kwargs.get("timeout_seconds", self._config.default_timeout),
             retry_count=kwargs.get("retry_count", self._config.default_retry_count),
         )
         self._steps.append(step)
         return self
 
-    def build(self) -> Workflow:
-        """Build and return the configured workflow."""
+    def build(self, context: WorkflowContext | None = None) -> Workflow:
+        """Build and return the configured workflow, optionally bound to a context."""
         logger.info(
             f"Building workflow '{self._config.name}' with {len(self._steps)} steps."
         )
-        return Workflow(self._config, self._steps)
+        return Workflow(
+            self._config, self._steps, _dependency_graph(self._steps), context
+        )